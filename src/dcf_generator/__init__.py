@@ -1,4 +1,25 @@
-from .config import DCFConfig, ScenarioSet
-from .pipeline import run_dcf_pipeline
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import DCFConfig, ScenarioSet
+    from .pipeline import run_dcf_pipeline
 
 __all__ = ["DCFConfig", "ScenarioSet", "run_dcf_pipeline"]
+
+_LAZY_EXPORTS = {
+    "DCFConfig": ".config",
+    "ScenarioSet": ".config",
+    "run_dcf_pipeline": ".pipeline",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+ETAG_CACHE_SIZE = 16
 
 
 @dataclass
@@ -15,30 +27,102 @@ class APIConfig:
 
 
 class BaseConnector:
+    _ENDPOINT = ""
+    _ROWS_KEY = ""
+    _PARAMS: dict[str, Any] | None = None
+
     def __init__(self, config: APIConfig):
         self.config = config
+        self._base_url = config.base_url.rstrip("/")
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {config.token}",
+                "Accept": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING,
+            }
+        )
+        self._etag_cache: OrderedDict[tuple, tuple[str, dict | list]] = OrderedDict()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
-    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict | list:
-        headers = {"Authorization": f"Bearer {self.config.token}", "Accept": "application/json"}
-        url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        resp = requests.get(url, headers=headers, params=params, timeout=20)
+    def _get(self, endpoint: str, params: dict[str, Any] | None = None, use_etag: bool = True) -> dict | list:
+        url = f"{self._base_url}/{endpoint.lstrip('/')}"
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(cache_key) if use_etag else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        resp = self._session.get(url, params=params, headers=headers, timeout=20)
+        if cached and resp.status_code == 304:
+            self._etag_cache.move_to_end(cache_key)
+            return cached[1]
         resp.raise_for_status()
-        return resp.json()
 
+        payload = json_loads(resp.content)
+        etag = resp.headers.get("ETag")
+        if use_etag and etag:
+            self._etag_cache[cache_key] = (etag, payload)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return payload
 
-class QuickBooksConnector(BaseConnector):
     def fetch_trial_balance(self) -> pd.DataFrame:
-        payload = self._get("reports/TrialBalance")
-        return pd.DataFrame(payload if isinstance(payload, list) else payload.get("rows", []))
+        return pd.DataFrame(self._to_rows(self._get(self._ENDPOINT, params=self._PARAMS)))
+
+    def _to_rows(self, payload: dict | list) -> list | tuple:
+        if isinstance(payload, list):
+            return payload
+        return payload.get(self._ROWS_KEY) or ()
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class QuickBooksConnector(BaseConnector):
+    _ENDPOINT = "reports/TrialBalance"
+    _ROWS_KEY = "rows"
 
 
 class XeroConnector(BaseConnector):
-    def fetch_trial_balance(self) -> pd.DataFrame:
-        payload = self._get("Reports/TrialBalance")
-        return pd.DataFrame(payload if isinstance(payload, list) else payload.get("Reports", []))
+    _ENDPOINT = "Reports/TrialBalance"
+    _ROWS_KEY = "Reports"
 
 
 class NetSuiteConnector(BaseConnector):
+    _ENDPOINT = "query/v1/suiteql"
+    _ROWS_KEY = "items"
+    _QUERY = "SELECT * FROM transaction"
+    PAGE_SIZE = 1000
+    MAX_PAGES = 1000
+
     def fetch_trial_balance(self) -> pd.DataFrame:
-        payload = self._get("query/v1/suiteql", params={"q": "SELECT * FROM transaction"})
-        return pd.DataFrame(payload if isinstance(payload, list) else payload.get("items", []))
+        pages = list(self.iter_pages())
+        if not pages:
+            return pd.DataFrame()
+        return pd.concat(pages, ignore_index=True)
+
+    def iter_pages(self, page_size: int = PAGE_SIZE) -> Iterator[pd.DataFrame]:
+        offset = 0
+        for _ in range(self.MAX_PAGES):
+            payload = self._get(
+                self._ENDPOINT, params={"q": self._QUERY, "limit": page_size, "offset": offset}, use_etag=False
+            )
+            rows = self._to_rows(payload)
+            if rows:
+                yield pd.DataFrame(rows)
+
+            offset += page_size
+            has_more = len(rows) == page_size
+            if isinstance(payload, dict):
+                has_more = bool(payload.get("hasMore", has_more))
+                total = payload.get("totalResults")
+                if total is not None and offset >= total:
+                    has_more = False
+            if not has_more:
+                return
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+import re
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Emu, Pt
+
+from .config import DCFConfig, apply_config_override, load_config_payload
+from .pipeline import run_dcf_pipeline
+
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+ROOT = Path(__file__).resolve().parents[2]
+OUTPUT_DIR = ROOT / "output"
+DEFAULT_INPUT = ROOT / "data" / "business_test_insurance.csv"
+DEFAULT_CONFIG = ROOT / "config.business_wacc24_tg2.json"
+DEFAULT_EXCEL_OUTPUT = OUTPUT_DIR / "business_test_wacc24_tg2_reportpack.xlsx"
+DEFAULT_WORD_OUTPUT = OUTPUT_DIR / "business_test_wacc24_tg2_report.docx"
+
+
+def load_config_override(path: Path, cfg: DCFConfig) -> DCFConfig:
+    return apply_config_override(cfg, load_config_payload(path))
+
+
+def fmt_m(value: float) -> str:
+    return f"${value/1_000_000:,.2f}M"
+
+
+def fast_add_table(doc: Document, rows: list[tuple[str, ...]], style_id: str = "LightList-Accent1") -> None:
+    section = doc.sections[-1]
+    col_width = Emu((section.page_width - section.left_margin - section.right_margin) // len(rows[0])).twips
+    grid = f'<w:gridCol w:w="{col_width}"/>' * len(rows[0])
+    cell = f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr><w:p><w:r><w:t xml:space="preserve">{{}}</w:t></w:r></w:p></w:tc>'
+    trs = "".join("<w:tr>" + "".join(cell.format(escape(text)) for text in row) + "</w:tr>" for row in rows)
+    tbl = parse_xml(
+        f"<w:tbl {nsdecls('w')}>"
+        f'<w:tblPr><w:tblStyle w:val="{style_id}"/><w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        f"</w:tblPr><w:tblGrid>{grid}</w:tblGrid>{trs}</w:tbl>"
+    )
+    doc.element.body.insert_element_before(tbl, "w:sectPr")
+
+
+@lru_cache(maxsize=1)
+def report_template() -> bytes:
+    doc = Document()
+    normal_style = doc.styles["Normal"]
+    normal_style.font.name = "Segoe UI"
+    normal_style.font.size = Pt(10.5)
+
+    doc.add_heading("PROJECT [COMPANY NAME] | VALUATION REPORT", level=1)
+    doc.add_paragraph("Date: {{date}}")
+    doc.add_paragraph("Strictly Private & Confidential | Prepared by Rounak Jain, CFA L2 Candidate")
+
+    doc.add_heading("Executive Summary", level=2)
+    doc.add_paragraph("Implied Enterprise Value Range: {{low}} - {{high}}")
+    doc.add_paragraph("Implied Equity Value Range: {{eq_low}} - {{eq_high}}")
+    doc.add_paragraph("WACC Assumption: 24.0% | Terminal Growth: 2.0% | Revenue Growth: 3.0%")
+
+    doc.add_heading("Investment Narrative", level=2)
+    doc.add_paragraph(
+        "At a conservative 24% discount rate, intrinsic value is approximately {{mid}}. "
+        "Against a $4.00M ask, buyers are implied to gain about {{upside}} of immediate equity value."
+    )
+
+    doc.add_heading("Method Detail", level=2)
+    fast_add_table(
+        doc,
+        [
+            ("Method", "Enterprise Value", "Equity Value"),
+            ("Gordon Growth", "{{ev_g}}", "{{eq_g}}"),
+            ("Exit Multiple", "{{ev_e}}", "{{eq_e}}"),
+        ],
+    )
+
+    doc.add_heading("Files Generated", level=2)
+    doc.add_paragraph("Excel Model: {{excel_name}}")
+    doc.add_paragraph("Word Report: {{word_name}}")
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def render_report(values: dict[str, str]) -> Document:
+    doc = Document(BytesIO(report_template()))
+    for text_node in doc.element.body.iter(qn("w:t")):
+        if text_node.text and "{{" in text_node.text:
+            text_node.text = PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(1)], text_node.text)
+    return doc
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the Excel model and Word valuation report pack")
+    parser.add_argument(
+        "--config-list",
+        nargs="+",
+        help="Run several JSON configs in one process; outputs are named after each config file",
+    )
+    return parser.parse_args()
+
+
+def generate_word_report() -> None:
+    args = parse_args()
+    if args.config_list:
+        jobs = []
+        for config in map(Path, args.config_list):
+            jobs.append((config, OUTPUT_DIR / f"{config.stem}_reportpack.xlsx", OUTPUT_DIR / f"{config.stem}_report.docx"))
+    else:
+        jobs = [(DEFAULT_CONFIG, DEFAULT_EXCEL_OUTPUT, DEFAULT_WORD_OUTPUT)]
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    report_date = date.today().isoformat()
+    for config_path, excel_output, word_output in jobs:
+        build_report_pack(DEFAULT_INPUT, config_path, excel_output, word_output, report_date)
+
+
+def build_report_pack(input_path: Path, config_path: Path, excel_output: Path, word_output: Path, report_date: str) -> None:
+    cfg = load_config_override(config_path, DCFConfig())
+    result = run_dcf_pipeline(input_path, excel_output, cfg, scenario_name="Base")
+    valuation = result["valuation_summary"]
+
+    ev_g = float(valuation["Enterprise Value (Gordon)"])
+    ev_e = float(valuation["Enterprise Value (Exit)"])
+    eq_g = float(valuation["Equity Value (Gordon)"])
+    eq_e = float(valuation["Equity Value (Exit)"])
+
+    low = min(ev_g, ev_e)
+    high = max(ev_g, ev_e)
+    midpoint = (low + high) / 2
+    ask_price = 4_000_000
+    upside = midpoint - ask_price
+    fmts = {
+        key: fmt_m(value)
+        for key, value in (
+            ("ev_g", ev_g),
+            ("ev_e", ev_e),
+            ("eq_g", eq_g),
+            ("eq_e", eq_e),
+            ("low", low),
+            ("high", high),
+            ("eq_low", min(eq_g, eq_e)),
+            ("eq_high", max(eq_g, eq_e)),
+            ("mid", midpoint),
+        )
+    }
+    fmts["date"] = report_date
+    fmts["upside"] = f"${upside:,.0f}"
+    fmts["excel_name"] = excel_output.name
+    fmts["word_name"] = word_output.name
+
+    render_report(fmts).save(word_output)
+
+    print(f"Excel generated: {excel_output}")
+    print(f"Word report generated: {word_output}")
+    print(f"EV Range: {fmts['low']} - {fmts['high']}")
+
+
+if __name__ == "__main__":
+    generate_word_report()
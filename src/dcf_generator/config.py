@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Literal
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Literal, Mapping
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 DiscountConvention = Literal["mid_year", "end_period"]
 TerminalMethod = Literal["gordon_growth", "exit_multiple", "both"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScenarioSet:
     revenue_multiplier: float = 1.0
     margin_delta_bps: float = 0.0
@@ -16,7 +25,16 @@ class ScenarioSet:
     capex_multiplier: float = 1.0
 
 
-@dataclass
+DEFAULT_SCENARIOS: Mapping[str, ScenarioSet] = MappingProxyType(
+    {
+        "Base": ScenarioSet(),
+        "Bull": ScenarioSet(revenue_multiplier=1.1, margin_delta_bps=150, working_capital_days_delta=-3),
+        "Bear": ScenarioSet(revenue_multiplier=0.9, margin_delta_bps=-150, working_capital_days_delta=4),
+    }
+)
+
+
+@dataclass(slots=True)
 class ForecastConfig:
     years: int = 5
     revenue_method: Literal["cagr", "yoy", "manual"] = "cagr"
@@ -45,7 +63,7 @@ class ForecastConfig:
     tax_rate: float = 0.25
 
 
-@dataclass
+@dataclass(slots=True)
 class WACCConfig:
     risk_free_rate: float = 0.042
     market_risk_premium: float = 0.055
@@ -58,7 +76,7 @@ class WACCConfig:
     tax_rate: float = 0.25
 
 
-@dataclass
+@dataclass(slots=True)
 class ValuationConfig:
     terminal_method: TerminalMethod = "both"
     terminal_growth_rate: float = 0.025
@@ -74,15 +92,40 @@ class ValuationConfig:
     terminal_spread_floor_bps: float = 50.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DCFConfig:
     forecast: ForecastConfig = field(default_factory=ForecastConfig)
     wacc: WACCConfig = field(default_factory=WACCConfig)
     valuation: ValuationConfig = field(default_factory=ValuationConfig)
-    scenarios: Dict[str, ScenarioSet] = field(
-        default_factory=lambda: {
-            "Base": ScenarioSet(),
-            "Bull": ScenarioSet(revenue_multiplier=1.1, margin_delta_bps=150, working_capital_days_delta=-3),
-            "Bear": ScenarioSet(revenue_multiplier=0.9, margin_delta_bps=-150, working_capital_days_delta=4),
-        }
-    )
+    scenarios: Dict[str, ScenarioSet] = field(default_factory=lambda: dict(DEFAULT_SCENARIOS))
+
+
+CONFIG_SECTION_FIELDS: Dict[str, frozenset[str]] = {
+    "forecast": frozenset(f.name for f in fields(ForecastConfig)),
+    "wacc": frozenset(f.name for f in fields(WACCConfig)),
+    "valuation": frozenset(f.name for f in fields(ValuationConfig)),
+}
+
+
+def apply_config_override(cfg: DCFConfig, payload: Dict[str, Any]) -> DCFConfig:
+    sections = [(name, values) for name, values in payload.items() if name in CONFIG_SECTION_FIELDS]
+    for name, values in sections:
+        unknown = values.keys() - CONFIG_SECTION_FIELDS[name]
+        if unknown:
+            raise ValueError(f"Unknown '{name}' config keys: {sorted(unknown)}")
+
+    for name, values in sections:
+        target = getattr(cfg, name)
+        for key, value in values.items():
+            setattr(target, key, deepcopy(value) if isinstance(value, (dict, list)) else value)
+    return cfg
+
+
+def load_config_payload(path: str | Path) -> Dict[str, Any]:
+    path = Path(path)
+    return deepcopy(_parse_config_file(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    return json_loads(Path(path).read_bytes())
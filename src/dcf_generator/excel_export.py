@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from itertools import zip_longest
 from pathlib import Path
+from typing import BinaryIO
 
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.chart import BarChart, LineChart, Reference
 from openpyxl.formatting.rule import ColorScaleRule, FormulaRule, CellIsRule
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, Color
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension, DimensionHolder
 
 from .config import DCFConfig, ScenarioSet
 from .wacc import WACCResult
@@ -17,10 +22,98 @@ ACCOUNTING_FMT = '_(* #,##0_);_(* (#,##0);_(* "-"??_);_(@_)'
 PCT_FMT = "0.00%"
 PRICE_FMT = "$#,##0.00"
 MILLIONS_FMT = "$#,##0.00,,\"M\""
+FORECAST_FORMULA_TEMPLATES = (
+    "=B{p}*(1+Inputs!B8*Inputs!B34)",
+    "=B{r}*Inputs!B9*(1-Inputs!B35/10000)",
+    "=B{r}*Inputs!B10",
+    "=B{r}-C{r}-D{r}",
+    "=B{r}*Inputs!B16",
+    "=E{r}-F{r}",
+    "=G{r}*(1-Inputs!B11)",
+    "=B{r}*Inputs!B15*Inputs!B37",
+    "=B{r}*Inputs!B12/365",
+    "=C{r}*Inputs!B14/365",
+    "=C{r}*Inputs!B13/365",
+    "=J{r}+K{r}-L{r}",
+    "=M{r}-M{p}",
+    "=H{r}+F{r}-I{r}-N{r}",
+    "=IF(Inputs!B33=\"mid_year\",1/(1+Valuation!B2)^(ROW()-1.5),1/(1+Valuation!B2)^(ROW()-1))",
+    "=O{r}*P{r}",
+)
+COLUMN_LETTERS = ("",) + tuple(get_column_letter(col_idx) for col_idx in range(1, 41))
+CHECK_FORMULA_TEMPLATES = (
+    "=Forecast!A{r}",
+    "=(Forecast!J{r}+Forecast!K{r})-(Forecast!L{r}+(Forecast!J{r}+Forecast!K{r}-Forecast!L{r}))",
+    "=IF(ABS(B{r})<0.01,\"PASS\",\"FAIL\")",
+    "=IF(Inputs!B26<=Inputs!B39,\"PASS\",\"ALERT\")",
+    "=IF(C{r}=\"PASS\",\"PASS\",\"REVIEW\")",
+)
+RISK_MAP_EV_TEMPLATES = tuple(
+    f"=Valuation!B3+((Valuation!B4*(1+$A{{r}}))/({col}$4-$A{{r}}))*Forecast!P6" for col in COLUMN_LETTERS[2:7]
+)
+RISK_MAP_PRICE_TEMPLATES = tuple(
+    f"=((Valuation!B10*(1+{col}$13+$A{{r}})-Inputs!B30-Inputs!B31-Inputs!B32+Inputs!B29)/Inputs!B28)"
+    for col in COLUMN_LETTERS[2:7]
+)
+REPORT_VALUATION_METRICS = (
+    ("wacc", "WACC"),
+    ("ev_gordon", "Enterprise Value (Gordon)"),
+    ("ev_exit", "Enterprise Value (Exit)"),
+    ("ev_blended", "Enterprise Value (Blended)"),
+    ("eq_gordon", "Equity Value (Gordon)"),
+    ("eq_exit", "Equity Value (Exit)"),
+    ("eq_blended", "Equity Value (Blended)"),
+    ("price_gordon", "Implied Price (Gordon)"),
+    ("price_exit", "Implied Price (Exit)"),
+    ("price_blended", "Implied Price (Blended)"),
+    ("terminal_spread", "Terminal WACC Spread"),
+)
+REPORT_CAPITAL_METRICS = (
+    ("cost_of_equity", "Cost of Equity"),
+    ("post_tax_cost_of_debt", "Post-tax Cost of Debt"),
+)
+INPUT_PERCENT_LABELS = frozenset(
+    {
+        "Revenue CAGR",
+        "COGS % Revenue",
+        "Opex % Revenue",
+        "Tax Rate",
+        "Capex % Revenue",
+        "Depreciation Rate",
+        "Risk-Free Rate",
+        "Market Risk Premium",
+        "Size Premium",
+        "Country Risk Premium",
+        "Debt Weight",
+        "Equity Weight",
+        "Pre-tax Cost of Debt",
+        "WACC Tax Rate",
+        "Terminal Growth Rate",
+        "GDP Growth Cap",
+        "Gordon Blend Weight",
+    }
+)
+REPORT_FORECAST_COLUMNS = ("Revenue", "COGS", "EBITDA", "Capex", "Delta NWC", "FCF")
 BODY_FONT = "Segoe UI"
 SOFT_RED = "C0504D"
-INPUT_FONT = Font(color="0000FF")
-FORMULA_FONT = Font(color="000000")
+INPUT_FONT = Font(color="0000FF", name=BODY_FONT)
+FORMULA_FONT = Font(color="000000", name=BODY_FONT)
+BOLD_FONT = Font(bold=True, name=BODY_FONT)
+HEADER_FONT = Font(bold=True, color="FFFFFF", name=BODY_FONT)
+KPI_TITLE_FONT = Font(bold=True, color="1F4E78", name=BODY_FONT)
+KPI_VALUE_FONT = Font(bold=True, size=13, color="1F4E78", name=BODY_FONT)
+RECOMMENDATION_FONT = Font(bold=True, size=11, color="1F4E78", name=BODY_FONT)
+SHEET_TITLE_FONT = Font(bold=True, size=14, color="FFFFFF", name=BODY_FONT)
+DASHBOARD_TITLE_FONT = Font(bold=True, size=15, color="FFFFFF", name=BODY_FONT)
+PRINT_TITLE_FONT = Font(bold=True, size=13, color="FFFFFF", name=BODY_FONT)
+SUBTITLE_FONT = Font(italic=True, color="555555", name=BODY_FONT)
+NARRATIVE_FONT = Font(italic=True, color="444444", name=BODY_FONT)
+FOOTNOTE_FONT = Font(italic=True, color="666666", name=BODY_FONT)
+NEGATIVE_FONT = Font(color=SOFT_RED, name=BODY_FONT)
+BODY_TEXT_FONT = Font(name=BODY_FONT, size=11, color=Color(theme=1))
+CENTER_ALIGN = Alignment(horizontal="center")
+TITLE_ALIGN = Alignment(horizontal="left", vertical="center")
+WRAP_CENTER_ALIGN = Alignment(wrap_text=True, vertical="center")
 HEADER_FILL = PatternFill(fill_type="solid", start_color="1F4E78", end_color="1F4E78")
 SECTION_FILL = PatternFill(fill_type="solid", start_color="D9E1F2", end_color="D9E1F2")
 TITLE_FILL = PatternFill(fill_type="solid", start_color="0F243E", end_color="0F243E")
@@ -34,10 +127,16 @@ THIN_BORDER = Border(
     top=Side(style="thin", color="D9D9D9"),
     bottom=Side(style="thin", color="D9D9D9"),
 )
+WHITE_BORDER = Border(
+    left=Side(style="thin", color="FFFFFF"),
+    right=Side(style="thin", color="FFFFFF"),
+    top=Side(style="thin", color="FFFFFF"),
+    bottom=Side(style="thin", color="FFFFFF"),
+)
 
 
 def export_workbook(
-    output_path: str | Path,
+    output_path: str | Path | BinaryIO,
     cfg: DCFConfig,
     scenario_name: str,
     scenario: ScenarioSet,
@@ -47,8 +146,9 @@ def export_workbook(
     valuation_summary: dict,
     historical_growth_3y_avg: float = 0.0,
 ) -> None:
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(output_path, (str, Path)):
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
     wb = Workbook()
     wb.remove(wb.active)
@@ -80,14 +180,14 @@ def _write_inputs(
     ws.sheet_view.showGridLines = False
     ws.merge_cells("A1:D1")
     ws["A1"] = "Automated DCF Model Generator"
-    ws["A1"].font = Font(bold=True, size=14, color="FFFFFF")
+    ws["A1"].font = SHEET_TITLE_FONT
     ws["A1"].fill = TITLE_FILL
-    ws["A1"].alignment = Alignment(horizontal="left", vertical="center")
+    ws["A1"].alignment = TITLE_ALIGN
     ws.row_dimensions[1].height = 24
 
     ws.merge_cells("A2:D2")
     ws["A2"] = "Model control center — edit blue cells only"
-    ws["A2"].font = Font(italic=True, color="555555")
+    ws["A2"].font = SUBTITLE_FONT
 
     ws["A3"] = "Period Basis"
     ws["B3"] = period_meta.get("period_basis", "unknown")
@@ -98,10 +198,15 @@ def _write_inputs(
     ws["A3"].fill = SECTION_FILL
     ws["A4"].fill = SECTION_FILL
     ws["A5"].fill = SECTION_FILL
-    ws["A3"].font = Font(bold=True)
-    ws["A4"].font = Font(bold=True)
-    ws["A5"].font = Font(bold=True)
-
+    ws["A3"].font = BOLD_FONT
+    ws["A4"].font = BOLD_FONT
+    ws["A5"].font = BOLD_FONT
+    ws["B3"].font = BODY_TEXT_FONT
+    ws["B4"].font = BODY_TEXT_FONT
+    ws["B5"].font = BODY_TEXT_FONT
+
+    first_period = forecast_df[["Revenue", "NWC", "Delta NWC"]].iloc[0].to_dict()
+    base_nwc = float(first_period["NWC"] - first_period["Delta NWC"])
     rows = [
         ("Revenue CAGR", cfg.forecast.revenue_cagr),
         ("COGS % Revenue", cfg.forecast.cogs_pct_revenue),
@@ -131,9 +236,9 @@ def _write_inputs(
         ("Discount Convention", cfg.valuation.discount_convention),
         ("Scenario Revenue Multiplier", scenario.revenue_multiplier),
         ("Scenario Margin Delta (bps)", scenario.margin_delta_bps),
-        ("Scenario Base NWC", float(forecast_df.iloc[0]["NWC"] - forecast_df.iloc[0]["Delta NWC"])),
+        ("Scenario Base NWC", base_nwc),
         ("Scenario Capex Multiplier", scenario.capex_multiplier),
-        ("Base Revenue", float(forecast_df.iloc[0]["Revenue"] / max(1 + (cfg.forecast.revenue_cagr * scenario.revenue_multiplier), 1e-9))),
+        ("Base Revenue", float(first_period["Revenue"] / max(1 + (cfg.forecast.revenue_cagr * scenario.revenue_multiplier), 1e-9))),
         ("GDP Growth Cap", cfg.valuation.gdp_growth_cap),
         ("Current Market Price", 0.0),
         ("Ask Price", 0.0),
@@ -145,23 +250,12 @@ def _write_inputs(
     ws["B7"] = "Value"
     _style_header_row(ws, 7, 2)
 
-    for i, (label, value) in enumerate(rows, start=8):
-        ws[f"A{i}"] = label
-        ws[f"B{i}"] = value
-        ws[f"B{i}"].font = INPUT_FONT
-        ws[f"B{i}"].number_format = _input_number_format(label, value)
-        ws[f"A{i}"].border = THIN_BORDER
-        ws[f"B{i}"].border = THIN_BORDER
-        if i % 2 == 0:
-            ws[f"A{i}"].fill = ALT_ROW_FILL
-            ws[f"B{i}"].fill = ALT_ROW_FILL
+    _append_banded_rows(ws, rows, 8, INPUT_FONT, _input_number_format)
+    _apply_negative_soft_red(ws, "B8:B43")
 
     ws.freeze_panes = "A8"
     ws.auto_filter.ref = "A7:B43"
-    ws.print_area = "A1:D45"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, "A1:D45")
 
 
 def _write_forecast(wb: Workbook, years: int, forecast_df: pd.DataFrame) -> None:
@@ -190,61 +284,42 @@ def _write_forecast(wb: Workbook, years: int, forecast_df: pd.DataFrame) -> None
         ws.cell(row=1, column=col_idx, value=header)
     _style_header_row(ws, 1, len(headers))
 
-    start_year = forecast_df.iloc[0]["period"].year
+    body_style = _cell_style(font=FORMULA_FONT, border=THIN_BORDER, number_format=ACCOUNTING_FMT)
+    body_alt_style = _cell_style(font=FORMULA_FONT, border=THIN_BORDER, number_format=ACCOUNTING_FMT, fill=ALT_ROW_FILL)
+    year_style = _cell_style(font=BODY_TEXT_FONT, border=THIN_BORDER, alignment=CENTER_ALIGN)
+    year_alt_style = _cell_style(font=BODY_TEXT_FONT, border=THIN_BORDER, alignment=CENTER_ALIGN, fill=ALT_ROW_FILL)
+
+    start_year = forecast_df["period"].iat[0].year
     for row in range(2, years + 2):
         year = start_year + (row - 2)
-        ws[f"A{row}"] = year
-
+        formulas = [template.format(r=row, p=row - 1) for template in FORECAST_FORMULA_TEMPLATES]
         if row == 2:
-            ws[f"B{row}"] = "=Inputs!B38*(1+Inputs!B8*Inputs!B34)"
-            ws[f"N{row}"] = "=M2-Inputs!B36"
-        else:
-            ws[f"B{row}"] = f"=B{row-1}*(1+Inputs!B8*Inputs!B34)"
-            ws[f"N{row}"] = f"=M{row}-M{row-1}"
-
-        ws[f"C{row}"] = f"=B{row}*Inputs!B9*(1-Inputs!B35/10000)"
-        ws[f"D{row}"] = f"=B{row}*Inputs!B10"
-        ws[f"E{row}"] = f"=B{row}-C{row}-D{row}"
-        ws[f"F{row}"] = f"=B{row}*Inputs!B16"
-        ws[f"G{row}"] = f"=E{row}-F{row}"
-        ws[f"H{row}"] = f"=G{row}*(1-Inputs!B11)"
-        ws[f"I{row}"] = f"=B{row}*Inputs!B15*Inputs!B37"
-        ws[f"J{row}"] = f"=B{row}*Inputs!B12/365"
-        ws[f"K{row}"] = f"=C{row}*Inputs!B14/365"
-        ws[f"L{row}"] = f"=C{row}*Inputs!B13/365"
-        ws[f"M{row}"] = f"=J{row}+K{row}-L{row}"
-        ws[f"O{row}"] = f"=H{row}+F{row}-I{row}-N{row}"
-        ws[f"P{row}"] = f"=IF(Inputs!B33=\"mid_year\",1/(1+Valuation!B2)^(ROW()-1.5),1/(1+Valuation!B2)^(ROW()-1))"
-        ws[f"Q{row}"] = f"=O{row}*P{row}"
-
-    for row in ws.iter_rows(min_row=2, max_row=years + 1, min_col=2, max_col=17):
-        for cell in row:
-            cell.font = FORMULA_FONT
-            cell.number_format = ACCOUNTING_FMT
-            cell.border = THIN_BORDER
-    for row in range(2, years + 2):
-        ws[f"A{row}"].alignment = Alignment(horizontal="center")
-        ws[f"A{row}"].border = THIN_BORDER
-        if row % 2 == 0:
-            for col_idx in range(1, 18):
-                ws.cell(row=row, column=col_idx).fill = ALT_ROW_FILL
-
-    ws[f"A{years+3}"] = "Total PV of FCF"
-    ws[f"B{years+3}"] = f"=SUM(Q2:Q{years+1})"
-    ws[f"A{years+3}"].font = Font(bold=True)
-    ws[f"B{years+3}"].font = FORMULA_FONT
-    ws[f"B{years+3}"].number_format = ACCOUNTING_FMT
-    ws[f"A{years+3}"].fill = SECTION_FILL
-    ws[f"B{years+3}"].fill = SECTION_FILL
-    ws[f"A{years+3}"].border = THIN_BORDER
-    ws[f"B{years+3}"].border = THIN_BORDER
+            formulas[0] = "=Inputs!B38*(1+Inputs!B8*Inputs!B34)"
+            formulas[12] = "=M2-Inputs!B36"
+
+        striped = row % 2 == 0
+        style = body_alt_style if striped else body_style
+        ws.append(
+            [_styled_cell(ws, year, year_alt_style if striped else year_style)]
+            + [_styled_cell(ws, formula, style) for formula in formulas]
+        )
+
+    ws.append([])
+    ws.append(
+        [
+            _styled_cell(ws, "Total PV of FCF", _cell_style(font=BOLD_FONT, fill=SECTION_FILL, border=THIN_BORDER)),
+            _styled_cell(
+                ws,
+                f"=SUM(Q2:Q{years+1})",
+                _cell_style(font=FORMULA_FONT, fill=SECTION_FILL, border=THIN_BORDER, number_format=ACCOUNTING_FMT),
+            ),
+        ]
+    )
 
+    _apply_negative_soft_red(ws, f"B2:Q{years+1} B{years+3}")
     ws.auto_filter.ref = f"A1:Q{years+1}"
     ws.freeze_panes = "A2"
-    ws.print_area = f"A1:Q{years+1}"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, f"A1:Q{years+1}")
 
 
 def _write_valuation(wb: Workbook, last_forecast_row: int) -> None:
@@ -278,47 +353,23 @@ def _write_valuation(wb: Workbook, last_forecast_row: int) -> None:
         ("Terminal Spread (WACC-g)", "=B2-Inputs!B26"),
     ]
 
-    for idx, (metric, formula) in enumerate(metrics_formulas, start=2):
-        ws[f"A{idx}"] = metric
-        ws[f"B{idx}"] = formula
-        ws[f"B{idx}"].font = FORMULA_FONT
-        if metric == "WACC":
-            ws[f"B{idx}"].number_format = PCT_FMT
-        elif "Implied Price" in metric:
-            ws[f"B{idx}"].number_format = PRICE_FMT
-        elif "Implied Exit Multiple" in metric:
-            ws[f"B{idx}"].number_format = "0.00x"
-        elif "Implied Perpetuity Growth" in metric or "Terminal Spread" in metric:
-            ws[f"B{idx}"].number_format = PCT_FMT
-        elif "Terminal FCF" in metric or "Terminal EBITDA" in metric:
-            ws[f"B{idx}"].number_format = ACCOUNTING_FMT
-        else:
-            ws[f"B{idx}"].number_format = MILLIONS_FMT
-        ws[f"A{idx}"].border = THIN_BORDER
-        ws[f"B{idx}"].border = THIN_BORDER
-        if idx % 2 == 0:
-            ws[f"A{idx}"].fill = ALT_ROW_FILL
-            ws[f"B{idx}"].fill = ALT_ROW_FILL
+    _append_banded_rows(ws, metrics_formulas, 2, FORMULA_FONT, _valuation_number_format)
+    _apply_negative_soft_red(ws, "B2:B21")
 
     ws["A23"] = "Model Integrity"
     ws["B23"] = "=IF(AND(Inputs!B26<=Inputs!B39,B21>=Inputs!B43/10000),\"PASS\",\"ALERT\")"
+    ws["A23"].font = BODY_TEXT_FONT
     ws["B23"].font = FORMULA_FONT
     ws["A23"].border = THIN_BORDER
     ws["B23"].border = THIN_BORDER
 
     ws.freeze_panes = "A2"
-    ws.print_area = "A1:D30"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, "A1:D30")
 
 
 def _write_sensitivity(wb: Workbook, cfg: DCFConfig, last_forecast_row: int, base_wacc: float) -> None:
     ws = wb.create_sheet("Sensitivity")
     ws.sheet_view.showGridLines = False
-    ws["A1"] = "Terminal Growth / WACC"
-    ws["A1"].font = Font(bold=True, color="FFFFFF")
-    ws["A1"].fill = HEADER_FILL
 
     wacc_values = [base_wacc - 0.02, base_wacc - 0.01, base_wacc, base_wacc + 0.01, base_wacc + 0.02]
     growth_values = [
@@ -328,32 +379,38 @@ def _write_sensitivity(wb: Workbook, cfg: DCFConfig, last_forecast_row: int, bas
         cfg.valuation.terminal_growth_rate + 0.005,
         cfg.valuation.terminal_growth_rate + 0.01,
     ]
+    formula_template = (
+        "=((Valuation!B3+((Valuation!B4*(1+$A{row}))/({col}$1-$A{row}))*Forecast!P{last_row})"
+        "+Inputs!B29-Inputs!B30-Inputs!B31-Inputs!B32)/Inputs!B28"
+    )
 
-    for col_idx, value in enumerate(wacc_values, start=2):
-        ws.cell(row=1, column=col_idx, value=float(value))
-        ws.cell(row=1, column=col_idx).number_format = PCT_FMT
+    header_style = _cell_style(font=HEADER_FONT, fill=HEADER_FILL, border=THIN_BORDER, alignment=CENTER_ALIGN)
+    wacc_style = _cell_style(
+        font=HEADER_FONT, fill=HEADER_FILL, border=THIN_BORDER, alignment=CENTER_ALIGN, number_format=PCT_FMT
+    )
+    growth_styles = (
+        _cell_style(font=BODY_TEXT_FONT, border=THIN_BORDER, number_format=PCT_FMT),
+        _cell_style(font=BODY_TEXT_FONT, border=THIN_BORDER, number_format=PCT_FMT, fill=ALT_ROW_FILL),
+    )
+    value_styles = (
+        _cell_style(font=FORMULA_FONT, border=THIN_BORDER, number_format=ACCOUNTING_FMT),
+        _cell_style(font=FORMULA_FONT, border=THIN_BORDER, number_format=ACCOUNTING_FMT, fill=ALT_ROW_FILL),
+    )
 
+    ws.append(
+        [_styled_cell(ws, "Terminal Growth / WACC", header_style)]
+        + [_styled_cell(ws, float(value), wacc_style) for value in wacc_values]
+    )
     for row_idx, growth in enumerate(growth_values, start=2):
-        ws.cell(row=row_idx, column=1, value=float(growth))
-        ws.cell(row=row_idx, column=1).number_format = PCT_FMT
-        for col_idx in range(2, 7):
-            wacc_cell = f"{get_column_letter(col_idx)}$1"
-            g_cell = f"$A{row_idx}"
-            formula = (
-                f"=((Valuation!B3+((Valuation!B4*(1+{g_cell}))/({wacc_cell}-{g_cell}))*Forecast!P{last_forecast_row})"
-                "+Inputs!B29-Inputs!B30-Inputs!B31-Inputs!B32)/Inputs!B28"
-            )
-            ws.cell(row=row_idx, column=col_idx, value=formula)
-            ws.cell(row=row_idx, column=col_idx).font = FORMULA_FONT
-            ws.cell(row=row_idx, column=col_idx).number_format = ACCOUNTING_FMT
-            ws.cell(row=row_idx, column=col_idx).border = THIN_BORDER
-
-    _style_header_row(ws, 1, 6)
-    for row_idx in range(2, 7):
-        ws.cell(row=row_idx, column=1).border = THIN_BORDER
-        if row_idx % 2 == 0:
-            for col_idx in range(1, 7):
-                ws.cell(row=row_idx, column=col_idx).fill = ALT_ROW_FILL
+        striped = row_idx % 2 == 0
+        values = [
+            formula_template.format(col=COLUMN_LETTERS[col_idx], row=row_idx, last_row=last_forecast_row)
+            for col_idx in range(2, 7)
+        ]
+        ws.append(
+            [_styled_cell(ws, float(growth), growth_styles[striped])]
+            + [_styled_cell(ws, value, value_styles[striped]) for value in values]
+        )
 
     rng = "B2:F6"
     ws.conditional_formatting.add(
@@ -368,11 +425,9 @@ def _write_sensitivity(wb: Workbook, cfg: DCFConfig, last_forecast_row: int, bas
             end_color="63BE7B",
         ),
     )
+    _apply_negative_soft_red(ws, rng)
     ws.freeze_panes = "A2"
-    ws.print_area = "A1:D12"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, "A1:D12")
 
 
 def _write_dashboard(wb: Workbook) -> None:
@@ -380,13 +435,13 @@ def _write_dashboard(wb: Workbook) -> None:
     ws.sheet_view.showGridLines = False
     ws.merge_cells("A1:N1")
     ws["A1"] = "Executive Dashboard"
-    ws["A1"].font = Font(bold=True, size=15, color="FFFFFF")
+    ws["A1"].font = DASHBOARD_TITLE_FONT
     ws["A1"].fill = TITLE_FILL
-    ws["A1"].alignment = Alignment(horizontal="left", vertical="center")
+    ws["A1"].alignment = TITLE_ALIGN
     ws.row_dimensions[1].height = 24
 
     ws["A3"] = "Key Valuation Outputs"
-    ws["A3"].font = Font(bold=True, color="1F4E78")
+    ws["A3"].font = KPI_TITLE_FONT
 
     kpi_metrics = [
         ("WACC", "=Valuation!B2", PCT_FMT),
@@ -396,20 +451,20 @@ def _write_dashboard(wb: Workbook) -> None:
         ("Price (Blended)", "=Valuation!B17", PRICE_FMT),
     ]
     for idx, (label, formula, fmt) in enumerate(kpi_metrics, start=2):
-        ws.cell(row=4, column=idx, value=label)
-        ws.cell(row=5, column=idx, value=formula)
-        ws.cell(row=4, column=idx).font = Font(bold=True, color="1F4E78")
-        ws.cell(row=4, column=idx).alignment = Alignment(horizontal="center")
-        ws.cell(row=5, column=idx).font = FORMULA_FONT
-        ws.cell(row=5, column=idx).number_format = fmt
-        ws.cell(row=5, column=idx).alignment = Alignment(horizontal="center")
-        ws.cell(row=4, column=idx).fill = KPI_FILL
-        ws.cell(row=5, column=idx).fill = KPI_FILL
-        ws.cell(row=4, column=idx).border = THIN_BORDER
-        ws.cell(row=5, column=idx).border = THIN_BORDER
+        label_cell = ws.cell(row=4, column=idx, value=label)
+        label_cell.font = KPI_TITLE_FONT
+        label_cell.alignment = CENTER_ALIGN
+        label_cell.fill = KPI_FILL
+        label_cell.border = THIN_BORDER
+        value_cell = ws.cell(row=5, column=idx, value=formula)
+        value_cell.font = FORMULA_FONT
+        value_cell.number_format = fmt
+        value_cell.alignment = CENTER_ALIGN
+        value_cell.fill = KPI_FILL
+        value_cell.border = THIN_BORDER
 
     ws["A8"] = "Football Field Valuation"
-    ws["A8"].font = Font(bold=True, color="1F4E78")
+    ws["A8"].font = KPI_TITLE_FONT
 
     ws["A10"] = "Method"
     ws["B10"] = "Implied Share Price"
@@ -425,6 +480,9 @@ def _write_dashboard(wb: Workbook) -> None:
     ws["B13"].border = THIN_BORDER
     ws["A13"].fill = ALT_ROW_FILL
     ws["B13"].fill = ALT_ROW_FILL
+    ws["A11"].font = BODY_TEXT_FONT
+    ws["A12"].font = BODY_TEXT_FONT
+    ws["A13"].font = BODY_TEXT_FONT
     ws["B11"].font = FORMULA_FONT
     ws["B12"].font = FORMULA_FONT
     ws["B13"].font = FORMULA_FONT
@@ -439,7 +497,7 @@ def _write_dashboard(wb: Workbook) -> None:
     ws["B12"].fill = ALT_ROW_FILL
 
     ws["A14"] = "Enterprise to Equity Bridge"
-    ws["A14"].font = Font(bold=True, color="1F4E78")
+    ws["A14"].font = KPI_TITLE_FONT
     ws["A15"] = "Enterprise Value (Blended)"
     ws["B15"] = "=Valuation!B12"
     ws["A16"] = "Less: Debt"
@@ -454,20 +512,23 @@ def _write_dashboard(wb: Workbook) -> None:
     ws["B20"] = "=SUM(B15:B19)"
 
     for row in range(15, 21):
-        ws[f"A{row}"].border = THIN_BORDER
-        ws[f"B{row}"].border = THIN_BORDER
-        ws[f"B{row}"].font = FORMULA_FONT
-        ws[f"B{row}"].number_format = MILLIONS_FMT if row in [15, 20] else ACCOUNTING_FMT
+        label_cell = ws.cell(row=row, column=1)
+        value_cell = ws.cell(row=row, column=2)
+        label_cell.border = THIN_BORDER
+        value_cell.border = THIN_BORDER
+        label_cell.font = BODY_TEXT_FONT
+        value_cell.font = FORMULA_FONT
+        value_cell.number_format = MILLIONS_FMT if row in (15, 20) else ACCOUNTING_FMT
         if row % 2 == 0:
-            ws[f"A{row}"].fill = ALT_ROW_FILL
-            ws[f"B{row}"].fill = ALT_ROW_FILL
-    ws["A20"].font = Font(bold=True, color="1F4E78")
-    ws["B20"].font = Font(bold=True, color="1F4E78")
+            label_cell.fill = ALT_ROW_FILL
+            value_cell.fill = ALT_ROW_FILL
+    ws["A20"].font = KPI_TITLE_FONT
+    ws["B20"].font = KPI_TITLE_FONT
     ws["A20"].fill = SECTION_FILL
     ws["B20"].fill = SECTION_FILL
 
     ws["D14"] = "Scenario Snapshot"
-    ws["D14"].font = Font(bold=True, color="1F4E78")
+    ws["D14"].font = KPI_TITLE_FONT
     ws["D15"] = "Scenario"
     ws["E15"] = "Implied Price"
     _style_header_row(ws, 15, 5)
@@ -480,16 +541,19 @@ def _write_dashboard(wb: Workbook) -> None:
     ws["D19"] = "Spread (Bull-Bear)"
     ws["E19"] = "=E18-E16"
     for row in range(16, 20):
-        ws[f"D{row}"].border = THIN_BORDER
-        ws[f"E{row}"].border = THIN_BORDER
-        ws[f"E{row}"].font = FORMULA_FONT
-        ws[f"E{row}"].number_format = PRICE_FMT
+        label_cell = ws.cell(row=row, column=4)
+        value_cell = ws.cell(row=row, column=5)
+        label_cell.border = THIN_BORDER
+        value_cell.border = THIN_BORDER
+        label_cell.font = BODY_TEXT_FONT
+        value_cell.font = FORMULA_FONT
+        value_cell.number_format = PRICE_FMT
         if row % 2 == 0:
-            ws[f"D{row}"].fill = ALT_ROW_FILL
-            ws[f"E{row}"].fill = ALT_ROW_FILL
+            label_cell.fill = ALT_ROW_FILL
+            value_cell.fill = ALT_ROW_FILL
 
     ws["G14"] = "Model Health"
-    ws["G14"].font = Font(bold=True, color="1F4E78")
+    ws["G14"].font = KPI_TITLE_FONT
     ws["G15"] = "Check"
     ws["H15"] = "Status"
     _style_header_row(ws, 15, 8)
@@ -502,6 +566,7 @@ def _write_dashboard(wb: Workbook) -> None:
     for row in [16, 17, 18]:
         ws[f"G{row}"].border = THIN_BORDER
         ws[f"H{row}"].border = THIN_BORDER
+        ws[f"G{row}"].font = BODY_TEXT_FONT
         ws[f"H{row}"].font = FORMULA_FONT
     ws.conditional_formatting.add("H16:H18", FormulaRule(formula=['H16="PASS"'], fill=PASS_FILL))
     ws.conditional_formatting.add("H16:H18", FormulaRule(formula=['H16="ALERT"'], fill=ALERT_FILL))
@@ -511,43 +576,35 @@ def _write_dashboard(wb: Workbook) -> None:
     _style_header_row(ws, 10, 11)
     for row in range(11, 16):
         src_row = row - 9
-        ws[f"J{row}"] = f"=Forecast!A{src_row}"
-        ws[f"K{row}"] = f"=Forecast!O{src_row}"
-        ws[f"J{row}"].border = THIN_BORDER
-        ws[f"K{row}"].border = THIN_BORDER
-        ws[f"K{row}"].number_format = MILLIONS_FMT
-
-    chart = BarChart()
-    chart.title = "Implied Price by Method"
-    chart.style = 10
-    chart.type = "col"
-    chart.grouping = "clustered"
-    data = Reference(ws, min_col=2, min_row=10, max_row=12)
-    categories = Reference(ws, min_col=1, min_row=11, max_row=12)
-    chart.add_data(data, titles_from_data=True)
-    chart.set_categories(categories)
-    chart.height = 4.8
-    chart.width = 5.8
-    ws.add_chart(chart, "H2")
+        year_cell = ws.cell(row=row, column=10, value=f"=Forecast!A{src_row}")
+        fcf_cell = ws.cell(row=row, column=11, value=f"=Forecast!O{src_row}")
+        year_cell.border = THIN_BORDER
+        fcf_cell.border = THIN_BORDER
+        year_cell.font = BODY_TEXT_FONT
+        fcf_cell.font = BODY_TEXT_FONT
+        fcf_cell.number_format = MILLIONS_FMT
+
+    _plot_chart(
+        ws,
+        _make_bar_chart("Implied Price by Method", "col", "clustered", 4.8, 5.8),
+        Reference(ws, min_col=2, min_row=10, max_row=12),
+        Reference(ws, min_col=1, min_row=11, max_row=12),
+        "H2",
+    )
 
-    trend = LineChart()
-    trend.title = "FCF Trend"
-    trend.style = 2
+    trend = _make_line_chart(4.8, 5.8, title="FCF Trend")
     trend.y_axis.title = "FCF"
     trend.x_axis.title = "Year"
-    trend_data = Reference(ws, min_col=11, min_row=10, max_row=15)
-    trend_cats = Reference(ws, min_col=10, min_row=11, max_row=15)
-    trend.add_data(trend_data, titles_from_data=True)
-    trend.set_categories(trend_cats)
-    trend.legend = None
-    trend.height = 4.8
-    trend.width = 5.8
-    ws.add_chart(trend, "H9")
-
-    ws.print_area = "A1:N35"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _plot_chart(
+        ws,
+        trend,
+        Reference(ws, min_col=11, min_row=10, max_row=15),
+        Reference(ws, min_col=10, min_row=11, max_row=15),
+        "H9",
+    )
+
+    _apply_negative_soft_red(ws, "C5:F5 B11:B13 B15:B20 E16:E19 K11:K15")
+    _finalize_sheet(ws, "A1:N35")
 
 
 def _write_report_data(
@@ -559,24 +616,19 @@ def _write_report_data(
     historical_growth_3y_avg: float,
 ) -> None:
     ws = wb.create_sheet("ReportData")
-    ws["A1"] = "metric"
-    ws["B1"] = "value"
+    summary_metrics = REPORT_VALUATION_METRICS + REPORT_CAPITAL_METRICS
+    summary_values = np.fromiter(
+        (valuation_summary.get(key, 0.0) for _, key in summary_metrics),
+        dtype=np.float64,
+        count=len(summary_metrics),
+    ).tolist()
+    summary_rows = [(name, value) for (name, _), value in zip(summary_metrics, summary_values)]
+    valuation_count = len(REPORT_VALUATION_METRICS)
     metrics = [
         ("scenario", scenario_name),
-        ("wacc", float(valuation_summary.get("WACC", 0.0))),
-        ("ev_gordon", float(valuation_summary.get("Enterprise Value (Gordon)", 0.0))),
-        ("ev_exit", float(valuation_summary.get("Enterprise Value (Exit)", 0.0))),
-        ("ev_blended", float(valuation_summary.get("Enterprise Value (Blended)", 0.0))),
-        ("eq_gordon", float(valuation_summary.get("Equity Value (Gordon)", 0.0))),
-        ("eq_exit", float(valuation_summary.get("Equity Value (Exit)", 0.0))),
-        ("eq_blended", float(valuation_summary.get("Equity Value (Blended)", 0.0))),
-        ("price_gordon", float(valuation_summary.get("Implied Price (Gordon)", 0.0))),
-        ("price_exit", float(valuation_summary.get("Implied Price (Exit)", 0.0))),
-        ("price_blended", float(valuation_summary.get("Implied Price (Blended)", 0.0))),
-        ("terminal_spread", float(valuation_summary.get("Terminal WACC Spread", 0.0))),
+        *summary_rows[:valuation_count],
         ("synthetic_rating", str(valuation_summary.get("Synthetic Rating", ""))),
-        ("cost_of_equity", float(valuation_summary.get("Cost of Equity", 0.0))),
-        ("post_tax_cost_of_debt", float(valuation_summary.get("Post-tax Cost of Debt", 0.0))),
+        *summary_rows[valuation_count:],
         ("risk_free", cfg.wacc.risk_free_rate),
         ("beta", cfg.wacc.beta),
         ("mrp", cfg.wacc.market_risk_premium),
@@ -586,26 +638,27 @@ def _write_report_data(
         ("revenue_cagr", cfg.forecast.revenue_cagr),
         ("historical_growth_3y_avg", historical_growth_3y_avg),
     ]
-    for idx, (key, value) in enumerate(metrics, start=2):
-        ws[f"A{idx}"] = key
-        ws[f"B{idx}"] = value
-
-    ws["D1"] = "period"
-    ws["E1"] = "Revenue"
-    ws["F1"] = "COGS"
-    ws["G1"] = "EBITDA"
-    ws["H1"] = "Capex"
-    ws["I1"] = "Delta NWC"
-    ws["J1"] = "FCF"
-
-    for row_idx, (_, row) in enumerate(forecast_df.iterrows(), start=2):
-        ws.cell(row=row_idx, column=4, value=str(row.get("period", ""))[:10])
-        ws.cell(row=row_idx, column=5, value=float(row.get("Revenue", 0.0)))
-        ws.cell(row=row_idx, column=6, value=float(row.get("COGS", 0.0)))
-        ws.cell(row=row_idx, column=7, value=float(row.get("EBITDA", 0.0)))
-        ws.cell(row=row_idx, column=8, value=float(row.get("Capex", 0.0)))
-        ws.cell(row=row_idx, column=9, value=float(row.get("Delta NWC", 0.0)))
-        ws.cell(row=row_idx, column=10, value=float(row.get("FCF", 0.0)))
+    amounts = forecast_df.reindex(columns=list(REPORT_FORECAST_COLUMNS), fill_value=0.0).to_numpy(dtype=float)
+    if "period" in forecast_df:
+        periods = pd.to_datetime(forecast_df["period"]).dt.strftime("%Y-%m-%d").tolist()
+    else:
+        periods = [""] * len(forecast_df)
+    forecast_rows = [(period, *row) for period, row in zip(periods, amounts.tolist())]
+
+    body_style = _cell_style(font=BODY_TEXT_FONT)
+    ws.append(
+        [
+            None if value is None else _styled_cell(ws, value, body_style)
+            for value in ("metric", "value", None, "period", *REPORT_FORECAST_COLUMNS)
+        ]
+    )
+    for metric, forecast_row in zip_longest(metrics, forecast_rows, fillvalue=()):
+        ws.append(
+            [
+                None if value is None else _styled_cell(ws, value, body_style)
+                for value in (*(metric or (None, None)), None, *forecast_row)
+            ]
+        )
 
     ws.sheet_state = "hidden"
 
@@ -620,31 +673,28 @@ def _write_checks(wb: Workbook, years: int) -> None:
     ws["E1"] = "Sanity Status"
     _style_header_row(ws, 1, 5)
 
+    check_style = _cell_style(font=FORMULA_FONT, border=THIN_BORDER)
+    check_alt_style = _cell_style(font=FORMULA_FONT, border=THIN_BORDER, fill=ALT_ROW_FILL)
+    amount_style = _cell_style(font=FORMULA_FONT, border=THIN_BORDER, number_format=ACCOUNTING_FMT)
+    amount_alt_style = _cell_style(font=FORMULA_FONT, border=THIN_BORDER, number_format=ACCOUNTING_FMT, fill=ALT_ROW_FILL)
+    row_styles = (
+        (check_style, amount_style, check_style, check_style, check_style),
+        (check_alt_style, amount_alt_style, check_alt_style, check_alt_style, check_alt_style),
+    )
+
     for row in range(2, years + 2):
-        ws[f"A{row}"] = f"=Forecast!A{row}"
-        ws[f"B{row}"] = f"=(Forecast!J{row}+Forecast!K{row})-(Forecast!L{row}+(Forecast!J{row}+Forecast!K{row}-Forecast!L{row}))"
-        ws[f"C{row}"] = f"=IF(ABS(B{row})<0.01,\"PASS\",\"FAIL\")"
-        ws[f"A{row}"].font = FORMULA_FONT
-        ws[f"B{row}"].font = FORMULA_FONT
-        ws[f"C{row}"].font = FORMULA_FONT
-        ws[f"B{row}"].number_format = ACCOUNTING_FMT
-        ws[f"A{row}"].border = THIN_BORDER
-        ws[f"B{row}"].border = THIN_BORDER
-        ws[f"C{row}"].border = THIN_BORDER
-        ws[f"D{row}"].border = THIN_BORDER
-        ws[f"E{row}"].border = THIN_BORDER
-        ws[f"D{row}"] = "=IF(Inputs!B26<=Inputs!B39,\"PASS\",\"ALERT\")"
-        ws[f"E{row}"] = f"=IF(C{row}=\"PASS\",\"PASS\",\"REVIEW\")"
-        ws[f"D{row}"].font = FORMULA_FONT
-        ws[f"E{row}"].font = FORMULA_FONT
-        if row % 2 == 0:
-            for col_idx in range(1, 6):
-                ws.cell(row=row, column=col_idx).fill = ALT_ROW_FILL
+        ws.append(
+            [
+                _styled_cell(ws, template.format(r=row), style)
+                for template, style in zip(CHECK_FORMULA_TEMPLATES, row_styles[row % 2 == 0])
+            ]
+        )
 
     base_row = years + 3
     ws[f"A{base_row}"] = "Model-level"
     ws[f"D{base_row}"] = "=IF(Inputs!B26<=Inputs!B39,\"PASS\",\"ALERT\")"
     ws[f"E{base_row}"] = "=IF(COUNTIF(C2:C{0},\"FAIL\")=0,\"PASS\",\"REVIEW\")".format(years + 1)
+    ws[f"A{base_row}"].font = BODY_TEXT_FONT
     ws[f"D{base_row}"].font = FORMULA_FONT
     ws[f"E{base_row}"].font = FORMULA_FONT
     ws[f"A{base_row}"].border = THIN_BORDER
@@ -664,11 +714,9 @@ def _write_checks(wb: Workbook, years: int) -> None:
         FormulaRule(formula=["D2=\"ALERT\""], fill=ALERT_FILL),
     )
 
+    _apply_negative_soft_red(ws, f"B2:B{years+1}")
     ws.freeze_panes = "A2"
-    ws.print_area = f"A1:E{base_row+2}"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, f"A1:E{base_row+2}")
 
 
 def _write_page1_executive_summary(wb: Workbook, years: int) -> None:
@@ -677,27 +725,27 @@ def _write_page1_executive_summary(wb: Workbook, years: int) -> None:
 
     ws.merge_cells("A1:J1")
     ws["A1"] = "1-Minute Manager | Executive Summary"
-    ws["A1"].font = Font(bold=True, size=14, color="FFFFFF")
+    ws["A1"].font = SHEET_TITLE_FONT
     ws["A1"].fill = TITLE_FILL
 
     ws.merge_cells("A3:D3")
     ws["A3"] = "The Answer"
-    ws["A3"].font = Font(bold=True, color="FFFFFF")
+    ws["A3"].font = HEADER_FONT
     ws["A3"].fill = HEADER_FILL
     ws.merge_cells("A4:D4")
     ws["A4"] = "EV Range"
-    ws["A4"].font = Font(bold=True, color="1F4E78")
+    ws["A4"].font = KPI_TITLE_FONT
     ws["A5"] = "=TEXT(Valuation!B10*0.90/1000000,\"$#,##0.0\")&\"M - \"&TEXT(Valuation!B10*1.10/1000000,\"$#,##0.0\")&\"M\""
-    ws["A5"].font = Font(bold=True, size=13, color="1F4E78")
+    ws["A5"].font = KPI_VALUE_FONT
     ws.merge_cells("A6:D6")
     ws["A6"] = "Share Price Range"
-    ws["A6"].font = Font(bold=True, color="1F4E78")
+    ws["A6"].font = KPI_TITLE_FONT
     ws["A7"] = "=TEXT(Valuation!B14*0.90,\"$#,##0.00\")&\" - \"&TEXT(Valuation!B14*1.10,\"$#,##0.00\")"
-    ws["A7"].font = Font(bold=True, size=13, color="1F4E78")
+    ws["A7"].font = KPI_VALUE_FONT
 
     ws.merge_cells("F3:J3")
     ws["F3"] = "Recommendation"
-    ws["F3"].font = Font(bold=True, color="FFFFFF")
+    ws["F3"].font = HEADER_FONT
     ws["F3"].fill = HEADER_FILL
     ws.merge_cells("F4:J7")
     ws["F4"] = (
@@ -707,11 +755,11 @@ def _write_page1_executive_summary(wb: Workbook, years: int) -> None:
         "\"Status: UNDERVALUED by \"&TEXT((Valuation!B14/IF(Inputs!B40>0,Inputs!B40,Inputs!B41)-1),\"0.0%\")&\" vs Current Market Price\","
         "\"Status: OVERVALUED by \"&TEXT((1-Valuation!B14/IF(Inputs!B40>0,Inputs!B40,Inputs!B41)),\"0.0%\")&\" vs Current Market Price\"))"
     )
-    ws["F4"].alignment = Alignment(wrap_text=True, vertical="center")
-    ws["F4"].font = Font(bold=True, size=11, color="1F4E78")
+    ws["F4"].alignment = WRAP_CENTER_ALIGN
+    ws["F4"].font = RECOMMENDATION_FONT
 
     ws["A9"] = "Football Field"
-    ws["A9"].font = Font(bold=True, color="1F4E78")
+    ws["A9"].font = KPI_TITLE_FONT
     ws["A10"] = "Method"
     ws["B10"] = "Low"
     ws["C10"] = "Base"
@@ -729,25 +777,22 @@ def _write_page1_executive_summary(wb: Workbook, years: int) -> None:
         ws[f"C{row}"] = data[2]
         ws[f"D{row}"] = data[3]
         for col in ["A", "B", "C", "D"]:
+            ws[f"{col}{row}"].font = BODY_TEXT_FONT
             ws[f"{col}{row}"].border = THIN_BORDER
         for col in ["B", "C", "D"]:
             ws[f"{col}{row}"].number_format = MILLIONS_FMT
 
-    ff_chart = BarChart()
-    ff_chart.type = "bar"
-    ff_chart.grouping = "stacked"
-    ff_chart.style = 10
-    ff_chart.title = "Valuation Range Comparison"
-    ff_data = Reference(ws, min_col=2, min_row=10, max_col=4, max_row=13)
-    ff_cat = Reference(ws, min_col=1, min_row=11, max_row=13)
-    ff_chart.add_data(ff_data, titles_from_data=True)
-    ff_chart.set_categories(ff_cat)
-    ff_chart.height = 6
-    ff_chart.width = 7
-    ws.add_chart(ff_chart, "F9")
+    _plot_chart(
+        ws,
+        _make_bar_chart("Valuation Range Comparison", "bar", "stacked", 6, 7),
+        Reference(ws, min_col=2, min_row=10, max_col=4, max_row=13),
+        Reference(ws, min_col=1, min_row=11, max_row=13),
+        "F9",
+    )
+    _apply_negative_soft_red(ws, "B11:D13 B18:I20")
 
     ws["A16"] = "Key Ratios (3Y Historical + 5Y Projected)"
-    ws["A16"].font = Font(bold=True, color="1F4E78")
+    ws["A16"].font = KPI_TITLE_FONT
     headers = ["Metric", "H-3", "H-2", "H-1", "Y1", "Y2", "Y3", "Y4", "Y5"]
     for idx, h in enumerate(headers, start=1):
         ws.cell(row=17, column=idx, value=h)
@@ -785,17 +830,16 @@ def _write_page1_executive_summary(wb: Workbook, years: int) -> None:
 
     for r in [18, 19, 20]:
         for c in range(1, 10):
-            ws.cell(row=r, column=c).border = THIN_BORDER
+            cell = ws.cell(row=r, column=c)
+            cell.font = BODY_TEXT_FONT
+            cell.border = THIN_BORDER
             if c >= 2:
-                ws.cell(row=r, column=c).number_format = PCT_FMT
+                cell.number_format = PCT_FMT
 
     ws["A23"] = "Report based on [BASE] Case Scenario"
-    ws["A23"].font = Font(italic=True, color="666666")
+    ws["A23"].font = FOOTNOTE_FONT
 
-    ws.print_area = "A1:J28"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, "A1:J28")
 
 
 def _write_page2_logic_check(wb: Workbook, years: int) -> None:
@@ -804,11 +848,11 @@ def _write_page2_logic_check(wb: Workbook, years: int) -> None:
 
     ws.merge_cells("A1:J1")
     ws["A1"] = "Logic Check | Assumptions & Drivers"
-    ws["A1"].font = Font(bold=True, size=14, color="FFFFFF")
+    ws["A1"].font = SHEET_TITLE_FONT
     ws["A1"].fill = TITLE_FILL
 
     ws["A3"] = "Revenue & Margins Trend"
-    ws["A3"].font = Font(bold=True, color="1F4E78")
+    ws["A3"].font = KPI_TITLE_FONT
     headers = ["Metric", "Y1", "Y2", "Y3", "Y4", "Y5"]
     for idx, h in enumerate(headers, start=1):
         ws.cell(row=4, column=idx, value=h)
@@ -830,39 +874,34 @@ def _write_page2_logic_check(wb: Workbook, years: int) -> None:
 
     for r in [5, 6]:
         for c in range(1, 7):
-            ws.cell(row=r, column=c).border = THIN_BORDER
+            cell = ws.cell(row=r, column=c)
+            cell.font = BODY_TEXT_FONT
+            cell.border = THIN_BORDER
             if c >= 2:
-                ws.cell(row=r, column=c).number_format = PCT_FMT
-
-    mini_growth = LineChart()
-    mini_growth.style = 2
-    mini_growth.height = 1.6
-    mini_growth.width = 3.2
-    mini_growth.legend = None
-    growth_data = Reference(ws, min_col=2, min_row=4, max_col=6, max_row=5)
-    growth_cat = Reference(ws, min_col=2, min_row=4, max_col=6)
-    mini_growth.add_data(growth_data, titles_from_data=True)
-    mini_growth.set_categories(growth_cat)
-    ws.add_chart(mini_growth, "H4")
-
-    mini_margin = LineChart()
-    mini_margin.style = 2
-    mini_margin.height = 1.6
-    mini_margin.width = 3.2
-    mini_margin.legend = None
-    margin_data = Reference(ws, min_col=2, min_row=4, max_col=6, max_row=6)
-    margin_cat = Reference(ws, min_col=2, min_row=4, max_col=6)
-    mini_margin.add_data(margin_data, titles_from_data=True)
-    mini_margin.set_categories(margin_cat)
-    ws.add_chart(mini_margin, "H7")
+                cell.number_format = PCT_FMT
+
+    _plot_chart(
+        ws,
+        _make_line_chart(1.6, 3.2),
+        Reference(ws, min_col=2, min_row=4, max_col=6, max_row=5),
+        Reference(ws, min_col=2, min_row=4, max_col=6),
+        "H4",
+    )
+    _plot_chart(
+        ws,
+        _make_line_chart(1.6, 3.2),
+        Reference(ws, min_col=2, min_row=4, max_col=6, max_row=6),
+        Reference(ws, min_col=2, min_row=4, max_col=6),
+        "H7",
+    )
 
     ws.merge_cells("A9:J10")
     ws["A9"] = "=\"Assumes revenue growth tapers from \"&TEXT(B5,\"0.0%\")&\" to \"&TEXT(Inputs!B26,\"0.0%\")&\" over 5 years as market saturation increases.\""
-    ws["A9"].alignment = Alignment(wrap_text=True, vertical="center")
-    ws["A9"].font = Font(italic=True, color="444444")
+    ws["A9"].alignment = WRAP_CENTER_ALIGN
+    ws["A9"].font = NARRATIVE_FONT
 
     ws["A12"] = "WACC Box"
-    ws["A12"].font = Font(bold=True, color="1F4E78")
+    ws["A12"].font = KPI_TITLE_FONT
     ws["A13"] = "Risk-Free Rate"
     ws["B13"] = "=Inputs!B17"
     ws["A14"] = "Equity Risk Premium"
@@ -872,6 +911,7 @@ def _write_page2_logic_check(wb: Workbook, years: int) -> None:
     ws["A16"] = "WACC"
     ws["B16"] = "=Valuation!B2"
     for r in range(13, 17):
+        ws[f"A{r}"].font = BODY_TEXT_FONT
         ws[f"A{r}"].border = THIN_BORDER
         ws[f"B{r}"].border = THIN_BORDER
         ws[f"B{r}"].font = FORMULA_FONT
@@ -879,22 +919,20 @@ def _write_page2_logic_check(wb: Workbook, years: int) -> None:
     ws["B14"].number_format = PCT_FMT
     ws["B16"].number_format = PCT_FMT
     ws["B16"].fill = KPI_FILL
-    ws["B16"].font = Font(bold=True, color="1F4E78")
+    ws["B16"].font = KPI_TITLE_FONT
 
     ws["E12"] = "Terminal Value Logic"
-    ws["E12"].font = Font(bold=True, color="1F4E78")
+    ws["E12"].font = KPI_TITLE_FONT
     ws.merge_cells("E13:J16")
     ws["E13"] = (
         "=\"Terminal Value based on \"&TEXT(Inputs!B26,\"0.0%\")"
         "&\" Perpetuity Growth Rate, implying a \"&TEXT(Inputs!B27,\"0.0x\")&\" Exit Multiple.\""
     )
-    ws["E13"].alignment = Alignment(wrap_text=True, vertical="center")
+    ws["E13"].alignment = WRAP_CENTER_ALIGN
+    ws["E13"].font = BODY_TEXT_FONT
     ws["E13"].border = THIN_BORDER
 
-    ws.print_area = "A1:J22"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, "A1:J22")
 
 
 def _write_page3_risk_map(wb: Workbook, years: int) -> None:
@@ -903,55 +941,44 @@ def _write_page3_risk_map(wb: Workbook, years: int) -> None:
 
     ws.merge_cells("A1:J1")
     ws["A1"] = "Risk Map | Sensitivity Analysis"
-    ws["A1"].font = Font(bold=True, size=14, color="FFFFFF")
+    ws["A1"].font = SHEET_TITLE_FONT
     ws["A1"].fill = TITLE_FILL
 
+    header_style = _cell_style(font=HEADER_FONT, fill=HEADER_FILL, border=THIN_BORDER, alignment=CENTER_ALIGN)
+    header_pct_style = _cell_style(
+        font=HEADER_FONT, fill=HEADER_FILL, border=THIN_BORDER, alignment=CENTER_ALIGN, number_format=PCT_FMT
+    )
+    axis_style = _cell_style(font=BODY_TEXT_FONT, border=WHITE_BORDER, number_format=PCT_FMT)
+    ev_style = _cell_style(font=BODY_TEXT_FONT, border=WHITE_BORDER, number_format=MILLIONS_FMT)
+    price_style = _cell_style(font=BODY_TEXT_FONT, border=WHITE_BORDER, number_format=PRICE_FMT)
+
     ws["A3"] = "Table 1: Enterprise Value vs WACC & Terminal Growth"
-    ws["A3"].font = Font(bold=True, color="1F4E78")
-    ws["A4"] = "g / WACC"
+    ws["A3"].font = KPI_TITLE_FONT
     tg_values = ["=Inputs!B26-0.01", "=Inputs!B26-0.005", "=Inputs!B26", "=Inputs!B26+0.005", "=Inputs!B26+0.01"]
     wacc_values = ["=Valuation!B2-0.02", "=Valuation!B2-0.01", "=Valuation!B2", "=Valuation!B2+0.01", "=Valuation!B2+0.02"]
-    for i, formula in enumerate(wacc_values, start=2):
-        ws.cell(row=4, column=i, value=formula)
-        ws.cell(row=4, column=i).number_format = PCT_FMT
+    ws.append(
+        [_styled_cell(ws, "g / WACC", header_style)]
+        + [_styled_cell(ws, formula, header_pct_style) for formula in wacc_values]
+    )
     for r, formula in enumerate(tg_values, start=5):
-        ws.cell(row=r, column=1, value=formula)
-        ws.cell(row=r, column=1).number_format = PCT_FMT
-        for c in range(2, 7):
-            wacc_cell = f"{get_column_letter(c)}$4"
-            g_cell = f"$A{r}"
-            ws.cell(row=r, column=c, value=f"=Valuation!B3+((Valuation!B4*(1+{g_cell}))/({wacc_cell}-{g_cell}))*Forecast!P6")
-            ws.cell(row=r, column=c).number_format = MILLIONS_FMT
-
-    _style_header_row(ws, 4, 6)
+        ws.append(
+            [_styled_cell(ws, formula, axis_style)]
+            + [_styled_cell(ws, template.format(r=r), ev_style) for template in RISK_MAP_EV_TEMPLATES]
+        )
 
     ws["A12"] = "Table 2: Share Price vs EBITDA Margin & Revenue Growth"
-    ws["A12"].font = Font(bold=True, color="1F4E78")
-    ws["A13"] = "Margin / Growth"
+    ws["A12"].font = KPI_TITLE_FONT
     margin_vals = ["-0.04", "-0.02", "0", "0.02", "0.04"]
     growth_vals = ["-0.03", "-0.015", "0", "0.015", "0.03"]
-    for i, val in enumerate(growth_vals, start=2):
-        ws.cell(row=13, column=i, value=float(val))
-        ws.cell(row=13, column=i).number_format = PCT_FMT
+    ws.append(
+        [_styled_cell(ws, "Margin / Growth", header_style)]
+        + [_styled_cell(ws, float(val), header_pct_style) for val in growth_vals]
+    )
     for r, val in enumerate(margin_vals, start=14):
-        ws.cell(row=r, column=1, value=float(val))
-        ws.cell(row=r, column=1).number_format = PCT_FMT
-        for c in range(2, 7):
-            rg = f"{get_column_letter(c)}$13"
-            mg = f"$A{r}"
-            ws.cell(row=r, column=c, value=f"=((Valuation!B10*(1+{rg}+{mg})-Inputs!B30-Inputs!B31-Inputs!B32+Inputs!B29)/Inputs!B28)")
-            ws.cell(row=r, column=c).number_format = PRICE_FMT
-
-    _style_header_row(ws, 13, 6)
-
-    for r in list(range(5, 10)) + list(range(14, 19)):
-        for c in range(1, 7):
-            ws.cell(row=r, column=c).border = Border(
-                left=Side(style="thin", color="FFFFFF"),
-                right=Side(style="thin", color="FFFFFF"),
-                top=Side(style="thin", color="FFFFFF"),
-                bottom=Side(style="thin", color="FFFFFF"),
-            )
+        ws.append(
+            [_styled_cell(ws, float(val), axis_style)]
+            + [_styled_cell(ws, template.format(r=r), price_style) for template in RISK_MAP_PRICE_TEMPLATES]
+        )
 
     ws.conditional_formatting.add(
         "B5:F9",
@@ -977,11 +1004,9 @@ def _write_page3_risk_map(wb: Workbook, years: int) -> None:
             end_color="D9EAD3",
         ),
     )
+    _apply_negative_soft_red(ws, "B5:F9 B14:F18")
 
-    ws.print_area = "A1:J24"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, "A1:J24")
 
 
 def _write_page4_engine_room(wb: Workbook, years: int) -> None:
@@ -990,7 +1015,7 @@ def _write_page4_engine_room(wb: Workbook, years: int) -> None:
 
     ws.merge_cells("A1:K1")
     ws["A1"] = "Engine Room | Full DCF Output"
-    ws["A1"].font = Font(bold=True, size=14, color="FFFFFF")
+    ws["A1"].font = SHEET_TITLE_FONT
     ws["A1"].fill = TITLE_FILL
 
     headers = ["Line Item", "Hist Y1", "Hist Y2", "Hist Y3", "Proj Y1", "Proj Y2", "Proj Y3", "Proj Y4", "Proj Y5", "Terminal", "Notes"]
@@ -1010,63 +1035,58 @@ def _write_page4_engine_room(wb: Workbook, years: int) -> None:
         "Unlevered Free Cash Flow",
         "Discount Factor (Period/Sales)",
     ]
-    for i, label in enumerate(row_labels, start=4):
-        ws[f"A{i}"] = label
-        ws[f"A{i}"].border = THIN_BORDER
-
-    # Projected / terminal links
+    # Projected column and terminal link per row
     mapping = {
-        4: ("E", "E", "Valuation!B5"),
-        5: ("F", "F", "Forecast!F6"),
-        6: ("G", "G", "Forecast!G6"),
-        7: ("", "", "=Forecast!G6-Forecast!H6"),
-        8: ("H", "H", "Forecast!H6"),
-        9: ("F", "F", "Forecast!F6"),
-        10: ("I", "I", "Forecast!I6"),
-        11: ("N", "N", "Forecast!N6"),
-        12: ("O", "O", "Valuation!B4"),
-        13: ("P", "P", "Forecast!P6"),
+        4: ("E", "=Valuation!B5"),
+        5: ("F", "=Forecast!F6"),
+        6: ("G", "=Forecast!G6"),
+        7: ("", "=Forecast!G6-Forecast!H6"),
+        8: ("H", "=Forecast!H6"),
+        9: ("F", "=Forecast!F6"),
+        10: ("I", "=Forecast!I6"),
+        11: ("N", "=Forecast!N6"),
+        12: ("O", "=Valuation!B4"),
+        13: ("P", "=Forecast!P6"),
+    }
+    notes = {
+        4: "Core operating profitability",
+        8: "After tax operating income",
+        12: "UFCF for DCF",
+        13: "Mid-year convention visible",
     }
 
-    for row_idx, (col_proj, col_proj_dup, terminal_formula) in mapping.items():
-        for col_offset, frow in enumerate(range(2, 7), start=5):
-            source_col = col_proj
-            if row_idx == 7:
-                ws.cell(row=row_idx, column=col_offset, value=f"=Forecast!G{frow}-Forecast!H{frow}")
-            else:
-                ws.cell(row=row_idx, column=col_offset, value=f"=Forecast!{source_col}{frow}")
-        ws.cell(row=row_idx, column=10, value=f"={terminal_formula}" if not str(terminal_formula).startswith("=") else terminal_formula)
-
-    # Historical proxy values (3 columns)
-    ws["B4"] = "=Forecast!E2/(1+Inputs!B8)^3"
-    ws["C4"] = "=Forecast!E2/(1+Inputs!B8)^2"
-    ws["D4"] = "=Forecast!E2/(1+Inputs!B8)"
-    for r in range(5, 13):
-        ws[f"B{r}"] = f"=E{r}"
-        ws[f"C{r}"] = f"=E{r}"
-        ws[f"D{r}"] = f"=E{r}"
-    ws["B13"] = "=Forecast!P2"
-    ws["C13"] = "=Forecast!P2"
-    ws["D13"] = "=Forecast!P2"
-
-    for r in range(4, 14):
-        for c in range(2, 11):
-            ws.cell(row=r, column=c).font = FORMULA_FONT
-            ws.cell(row=r, column=c).border = THIN_BORDER
-            if r == 13:
-                ws.cell(row=r, column=c).number_format = "0.0000"
-            else:
-                ws.cell(row=r, column=c).number_format = MILLIONS_FMT if r in [4, 8, 12] else ACCOUNTING_FMT
-
-    ws["K4"] = "Core operating profitability"
-    ws["K8"] = "After tax operating income"
-    ws["K12"] = "UFCF for DCF"
-    ws["K13"] = "Mid-year convention visible"
-
-    ws.print_area = "A1:K18"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    label_style = _cell_style(font=BODY_TEXT_FONT, border=THIN_BORDER)
+    note_style = _cell_style(font=BODY_TEXT_FONT)
+    value_styles = {
+        number_format: _cell_style(font=FORMULA_FONT, border=THIN_BORDER, number_format=number_format)
+        for number_format in (MILLIONS_FMT, ACCOUNTING_FMT, "0.0000")
+    }
+
+    for (row_idx, (source_col, terminal_formula)), label in zip(mapping.items(), row_labels):
+        # Historical proxy values (3 columns)
+        if row_idx == 4:
+            history = ["=Forecast!E2/(1+Inputs!B8)^3", "=Forecast!E2/(1+Inputs!B8)^2", "=Forecast!E2/(1+Inputs!B8)"]
+        elif row_idx == 13:
+            history = ["=Forecast!P2"] * 3
+        else:
+            history = [f"=E{row_idx}"] * 3
+        if row_idx == 7:
+            projected = [f"=Forecast!G{frow}-Forecast!H{frow}" for frow in range(2, 7)]
+        else:
+            projected = [f"=Forecast!{source_col}{frow}" for frow in range(2, 7)]
+
+        if row_idx == 13:
+            value_style = value_styles["0.0000"]
+        else:
+            value_style = value_styles[MILLIONS_FMT if row_idx in (4, 8, 12) else ACCOUNTING_FMT]
+        ws.append(
+            [_styled_cell(ws, label, label_style)]
+            + [_styled_cell(ws, formula, value_style) for formula in (*history, *projected, terminal_formula)]
+            + [_styled_cell(ws, notes[row_idx], note_style) if row_idx in notes else None]
+        )
+
+    _apply_negative_soft_red(ws, "B4:J13")
+    _finalize_sheet(ws, "A1:K18")
 
 
 def _write_print_report(wb: Workbook) -> None:
@@ -1074,7 +1094,7 @@ def _write_print_report(wb: Workbook) -> None:
     ws.sheet_view.showGridLines = False
     ws.merge_cells("A1:H1")
     ws["A1"] = "Print Report Assembly"
-    ws["A1"].font = Font(bold=True, size=13, color="FFFFFF")
+    ws["A1"].font = PRINT_TITLE_FONT
     ws["A1"].fill = TITLE_FILL
 
     steps = [
@@ -1085,19 +1105,22 @@ def _write_print_report(wb: Workbook) -> None:
         "5) Validate headers/footers and confidentiality footer before sending.",
     ]
     ws["A3"] = "Action Plan"
-    ws["A3"].font = Font(bold=True, color="1F4E78")
+    ws["A3"].font = KPI_TITLE_FONT
     for i, text in enumerate(steps, start=4):
         ws[f"A{i}"] = text
+        ws[f"A{i}"].font = BODY_TEXT_FONT
         ws[f"A{i}"].border = THIN_BORDER
         if i % 2 == 0:
             ws[f"A{i}"].fill = ALT_ROW_FILL
 
     ws["A11"] = "Quick Checks"
-    ws["A11"].font = Font(bold=True, color="1F4E78")
+    ws["A11"].font = KPI_TITLE_FONT
     ws["A12"] = "Looks Big-4 quality?"
     ws["B12"] = "=IF(AND(Page_1_Executive!B5<>\"\",Page_4_Engine_Room!E12<>\"\"),\"YES\",\"REVIEW\")"
     ws["A13"] = "Confidential footer present?"
     ws["B13"] = "=IF(Page_1_Executive!A1<>\"\",\"YES\",\"REVIEW\")"
+    ws["A12"].font = BODY_TEXT_FONT
+    ws["A13"].font = BODY_TEXT_FONT
     ws["B12"].font = FORMULA_FONT
     ws["B13"].font = FORMULA_FONT
     ws["A12"].border = THIN_BORDER
@@ -1105,60 +1128,75 @@ def _write_print_report(wb: Workbook) -> None:
     ws["A13"].border = THIN_BORDER
     ws["B13"].border = THIN_BORDER
 
-    ws.print_area = "A1:H40"
-    ws.page_setup.fitToWidth = 1
-    ws.page_setup.fitToHeight = 0
-    _autosize(ws)
+    _finalize_sheet(ws, "A1:H40")
+
+
+def _cell_style(font=None, fill=None, border=None, alignment=None, number_format=None):
+    style = {"font": font, "fill": fill, "border": border, "alignment": alignment, "number_format": number_format}
+    return {name: value for name, value in style.items() if value is not None}
+
+
+def _styled_cell(ws, value, style):
+    cell = WriteOnlyCell(ws, value=value)
+    for name, attr in style.items():
+        setattr(cell, name, attr)
+    return cell
 
 
-def _excel_safe_value(value):
-    if hasattr(value, "to_pydatetime"):
-        return value.to_pydatetime()
-    return value
+def _append_banded_rows(ws, rows, start_row: int, value_font: Font, number_format) -> None:
+    label_styles = (
+        _cell_style(font=BODY_TEXT_FONT, border=THIN_BORDER),
+        _cell_style(font=BODY_TEXT_FONT, border=THIN_BORDER, fill=ALT_ROW_FILL),
+    )
+    value_styles = {}
+    for row_idx, (label, value) in enumerate(rows, start=start_row):
+        striped = row_idx % 2 == 0
+        style_key = (number_format(label, value), striped)
+        if style_key not in value_styles:
+            value_styles[style_key] = _cell_style(
+                font=value_font,
+                border=THIN_BORDER,
+                number_format=style_key[0],
+                fill=ALT_ROW_FILL if striped else None,
+            )
+        ws.append([_styled_cell(ws, label, label_styles[striped]), _styled_cell(ws, value, value_styles[style_key])])
 
 
 def _style_header_row(ws, row_number: int, max_col: int) -> None:
     for col in range(1, max_col + 1):
         cell = ws.cell(row=row_number, column=col)
-        cell.font = Font(bold=True, color="FFFFFF")
+        cell.font = HEADER_FONT
         cell.fill = HEADER_FILL
         cell.border = THIN_BORDER
-        cell.alignment = Alignment(horizontal="center")
+        cell.alignment = CENTER_ALIGN
 
 
 def _input_number_format(label: str, value) -> str:
     if not isinstance(value, (int, float)):
         return "General"
-    percent_labels = {
-        "Revenue CAGR",
-        "COGS % Revenue",
-        "Opex % Revenue",
-        "Tax Rate",
-        "Capex % Revenue",
-        "Depreciation Rate",
-        "Risk-Free Rate",
-        "Market Risk Premium",
-        "Size Premium",
-        "Country Risk Premium",
-        "Debt Weight",
-        "Equity Weight",
-        "Pre-tax Cost of Debt",
-        "WACC Tax Rate",
-        "Terminal Growth Rate",
-        "GDP Growth Cap",
-        "Gordon Blend Weight",
-    }
-    if label in percent_labels:
+    if label in INPUT_PERCENT_LABELS:
         return PCT_FMT
     if "Spread Floor" in label:
         return "0.0"
     if "Shares" in label:
         return "#,##0"
-    if any(x in label for x in ["Cash", "Debt", "Interest", "Stock", "Revenue", "NWC"]):
-        return ACCOUNTING_FMT
     return ACCOUNTING_FMT
 
 
+def _valuation_number_format(metric: str, formula=None) -> str:
+    if metric == "WACC":
+        return PCT_FMT
+    if "Implied Price" in metric:
+        return PRICE_FMT
+    if "Implied Exit Multiple" in metric:
+        return "0.00x"
+    if "Implied Perpetuity Growth" in metric or "Terminal Spread" in metric:
+        return PCT_FMT
+    if "Terminal FCF" in metric or "Terminal EBITDA" in metric:
+        return ACCOUNTING_FMT
+    return MILLIONS_FMT
+
+
 def _apply_workbook_theme(wb: Workbook) -> None:
     tab_colors = {
         "Dashboard": "1F4E78",
@@ -1189,8 +1227,6 @@ def _apply_workbook_theme(wb: Workbook) -> None:
         if color:
             ws.sheet_properties.tabColor = color
         _apply_header_footer(ws)
-        _apply_font_family(ws, BODY_FONT)
-        _apply_negative_soft_red(ws)
 
 
 def _apply_header_footer(ws) -> None:
@@ -1199,34 +1235,69 @@ def _apply_header_footer(ws) -> None:
     ws.oddFooter.center.text = "Strictly Private & Confidential | Prepared by Rounak Jain, CFA L2 Candidate"
 
 
-def _apply_font_family(ws, font_name: str) -> None:
-    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-        for cell in row:
-            if cell.value is None:
-                continue
-            old_font = cell.font or Font()
-            cell.font = Font(
-                name=font_name,
-                size=old_font.sz,
-                bold=old_font.bold,
-                italic=old_font.italic,
-                color=old_font.color,
-                underline=old_font.underline,
-            )
-
-
-def _apply_negative_soft_red(ws) -> None:
-    max_row = max(ws.max_row, 1)
-    max_col = max(ws.max_column, 1)
-    rng = f"A1:{get_column_letter(max_col)}{max_row}"
+def _apply_negative_soft_red(ws, cell_range: str) -> None:
     ws.conditional_formatting.add(
-        rng,
-        CellIsRule(operator="lessThan", formula=["0"], font=Font(color=SOFT_RED, name=BODY_FONT)),
+        cell_range,
+        CellIsRule(operator="lessThan", formula=["0"], font=NEGATIVE_FONT),
     )
 
 
+def _make_bar_chart(title: str, bar_type: str, grouping: str, height: float, width: float) -> BarChart:
+    chart = BarChart()
+    chart.type = bar_type
+    chart.grouping = grouping
+    chart.style = 10
+    chart.title = title
+    chart.height = height
+    chart.width = width
+    return chart
+
+
+def _make_line_chart(height: float, width: float, title: str | None = None) -> LineChart:
+    chart = LineChart()
+    chart.style = 2
+    if title is not None:
+        chart.title = title
+    chart.legend = None
+    chart.height = height
+    chart.width = width
+    return chart
+
+
+def _plot_chart(ws, chart, data: Reference, categories: Reference, anchor: str) -> None:
+    chart.add_data(data, titles_from_data=True)
+    chart.set_categories(categories)
+    ws.add_chart(chart, anchor)
+
+
+def _finalize_sheet(ws, print_area: str) -> None:
+    ws.print_area = print_area
+    ws.page_setup.fitToWidth = 1
+    ws.page_setup.fitToHeight = 0
+    _autosize(ws)
+
+
 def _autosize(ws) -> None:
-    for col in ws.columns:
-        col_letter = get_column_letter(col[0].column)
-        max_len = max(len(str(cell.value)) if cell.value is not None else 0 for cell in col)
-        ws.column_dimensions[col_letter].width = min(max(max_len + 2, 10), 40)
+    cells = _populated_cells(ws)
+    if not cells:
+        return
+    max_lens = {}
+    for (_, col_idx), cell in cells.items():
+        value = cell.value
+        if value is None:
+            continue
+        length = len(value) if isinstance(value, str) else len(str(value))
+        if length > max_lens.get(col_idx, 0):
+            max_lens[col_idx] = length
+    dimensions = DimensionHolder(worksheet=ws, default_factory=ws.column_dimensions.default_factory)
+    for col_idx in range(1, ws.max_column + 1):
+        col_letter = get_column_letter(col_idx)
+        dimensions[col_letter] = ColumnDimension(
+            ws, index=col_letter, width=min(max(max_lens.get(col_idx, 0) + 2, 10), 40)
+        )
+    ws.column_dimensions = dimensions
+
+
+def _populated_cells(ws) -> dict:
+    # Private map of written cells; ws.columns would materialise the whole grid.
+    return ws._cells
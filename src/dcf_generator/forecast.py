@@ -8,6 +8,18 @@ import pandas as pd
 from .config import ForecastConfig, ScenarioSet
 
 
+HISTORICAL_ACCOUNTS = (
+    "Revenue",
+    "COGS",
+    "Operating Expenses",
+    "Depreciation",
+    "Accounts Receivable",
+    "Inventory",
+    "Accounts Payable",
+    "PPE",
+)
+
+
 @dataclass
 class ForecastResult:
     forecast: pd.DataFrame
@@ -22,77 +34,71 @@ def build_forecast(mapped_data: pd.DataFrame, cfg: ForecastConfig, scenario: Sce
     last_period = hist["period"].max()
     base_row = hist.sort_values("period").iloc[-1]
 
-    periods = [pd.Timestamp(last_period) + pd.DateOffset(years=i) for i in range(1, cfg.years + 1)]
-    rows: list[dict] = []
+    years = cfg.years
+    periods = [pd.Timestamp(last_period) + pd.DateOffset(years=i) for i in range(1, years + 1)]
 
-    revenue = float(base_row["Revenue"])
+    growth = np.array([_revenue_growth(cfg, idx) for idx in range(1, years + 1)], dtype=float)
+    base_revenue = float(base_row["Revenue"])
+    revenue = base_revenue * np.cumprod((1 + growth) * scenario.revenue_multiplier)
     gross_margin_shift = scenario.margin_delta_bps / 10_000
 
-    ppe_existing = max(float(base_row.get("PPE", revenue * 0.2)), 0.0)
-    ppe_new = 0.0
-
-    for idx, period in enumerate(periods, start=1):
-        growth = _revenue_growth(cfg, idx)
-        revenue = revenue * (1 + growth) * scenario.revenue_multiplier
-
-        cogs = _cost_value(cfg.cogs_method, cfg.cogs_pct_revenue, cfg.cogs_fixed, cfg.cogs_inflation, revenue, idx, hist, "COGS")
-        opex = _cost_value(cfg.opex_method, cfg.opex_pct_revenue, cfg.opex_fixed, cfg.opex_inflation, revenue, idx, hist, "Operating Expenses")
-
-        cogs = cogs * (1 - gross_margin_shift)
-        ebitda = revenue - cogs - opex
-
-        capex = revenue * cfg.capex_pct_revenue if cfg.capex_method == "pct_revenue" else cfg.capex_fixed
-        capex *= scenario.capex_multiplier
-
-        dep_existing = ppe_existing * cfg.depreciation_rate
-        dep_new = ppe_new * cfg.depreciation_rate
-        depreciation = dep_existing + dep_new
-
-        ebit = ebitda - depreciation
-        nopat = ebit * (1 - cfg.tax_rate)
-
-        adj_dso = cfg.dso + scenario.working_capital_days_delta
-        adj_dpo = cfg.dpo + scenario.working_capital_days_delta
-        adj_dio = cfg.dio + scenario.working_capital_days_delta
-
-        ar = revenue * adj_dso / 365
-        inv = cogs * adj_dio / 365
-        ap = cogs * adj_dpo / 365
-        nwc = ar + inv - ap
-
-        prev_nwc = rows[-1]["NWC"] if rows else float(base_row.get("NWC", nwc))
-        delta_nwc = nwc - prev_nwc
-
-        fcf = nopat + depreciation - capex - delta_nwc
-
-        rows.append(
-            {
-                "period": period,
-                "Revenue": revenue,
-                "COGS": cogs,
-                "Operating Expenses": opex,
-                "EBITDA": ebitda,
-                "Depreciation": depreciation,
-                "EBIT": ebit,
-                "NOPAT": nopat,
-                "Capex": capex,
-                "AR": ar,
-                "Inventory": inv,
-                "AP": ap,
-                "NWC": nwc,
-                "Delta NWC": delta_nwc,
-                "FCF": fcf,
-                "PPE Existing": ppe_existing,
-                "PPE New": ppe_new,
-                "Dep Existing": dep_existing,
-                "Dep New": dep_new,
-            }
-        )
-
-        ppe_existing = max(ppe_existing - dep_existing, 0)
-        ppe_new = max(ppe_new + capex - dep_new, 0)
-
-    fc = pd.DataFrame(rows)
+    hist_means = hist[["COGS", "Operating Expenses"]].tail(3).mean()
+    cogs = _cost_value(cfg.cogs_method, cfg.cogs_pct_revenue, cfg.cogs_fixed, cfg.cogs_inflation, revenue, hist_means["COGS"])
+    opex = _cost_value(
+        cfg.opex_method, cfg.opex_pct_revenue, cfg.opex_fixed, cfg.opex_inflation, revenue, hist_means["Operating Expenses"]
+    )
+
+    cogs = cogs * (1 - gross_margin_shift)
+    ebitda = revenue - cogs - opex
+
+    capex = revenue * cfg.capex_pct_revenue if cfg.capex_method == "pct_revenue" else np.full(years, float(cfg.capex_fixed))
+    capex = capex * scenario.capex_multiplier
+
+    ppe_existing, ppe_new, dep_existing, dep_new = _roll_ppe(
+        capex, max(float(base_row.get("PPE", base_revenue * 0.2)), 0.0), cfg.depreciation_rate
+    )
+    depreciation = dep_existing + dep_new
+
+    ebit = ebitda - depreciation
+    nopat = ebit * (1 - cfg.tax_rate)
+
+    adj_dso = cfg.dso + scenario.working_capital_days_delta
+    adj_dpo = cfg.dpo + scenario.working_capital_days_delta
+    adj_dio = cfg.dio + scenario.working_capital_days_delta
+
+    ar = revenue * adj_dso / 365
+    inv = cogs * adj_dio / 365
+    ap = cogs * adj_dpo / 365
+    nwc = ar + inv - ap
+
+    opening_nwc = float(base_row.get("NWC", nwc[0]))
+    delta_nwc = np.diff(nwc, prepend=opening_nwc)
+
+    fcf = nopat + depreciation - capex - delta_nwc
+
+    fc = pd.DataFrame(
+        {
+            "period": periods,
+            "Revenue": revenue,
+            "COGS": cogs,
+            "Operating Expenses": opex,
+            "EBITDA": ebitda,
+            "Depreciation": depreciation,
+            "EBIT": ebit,
+            "NOPAT": nopat,
+            "Capex": capex,
+            "AR": ar,
+            "Inventory": inv,
+            "AP": ap,
+            "NWC": nwc,
+            "Delta NWC": delta_nwc,
+            "FCF": fcf,
+            "PPE Existing": ppe_existing,
+            "PPE New": ppe_new,
+            "Dep Existing": dep_existing,
+            "Dep New": dep_new,
+        }
+    )
     schedules = {
         "capex_dep": fc[["period", "PPE Existing", "PPE New", "Capex", "Dep Existing", "Dep New", "Depreciation"]].copy(),
         "working_capital": fc[["period", "AR", "Inventory", "AP", "NWC", "Delta NWC"]].copy(),
@@ -101,22 +107,16 @@ def build_forecast(mapped_data: pd.DataFrame, cfg: ForecastConfig, scenario: Sce
 
 
 def _build_historical_summary(mapped_data: pd.DataFrame) -> pd.DataFrame:
+    periods = pd.Index(mapped_data["period"].unique()).sort_values(na_position="first")
+    required = mapped_data[mapped_data["standard_account"].isin(HISTORICAL_ACCOUNTS)]
     grouped = (
-        mapped_data.groupby(["period", "standard_account"], dropna=False)["amount"]
+        required.groupby(["period", "standard_account"], dropna=False, observed=True)["amount"]
         .sum()
-        .reset_index()
-        .pivot(index="period", columns="standard_account", values="amount")
-        .fillna(0.0)
-        .reset_index()
+        .unstack(fill_value=0.0)
+        .reindex(index=periods, columns=HISTORICAL_ACCOUNTS, fill_value=0.0)
     )
-
-    for col in ["Revenue", "COGS", "Operating Expenses", "Depreciation", "Accounts Receivable", "Inventory", "Accounts Payable"]:
-        if col not in grouped.columns:
-            grouped[col] = 0.0
-
     grouped["NWC"] = grouped["Accounts Receivable"] + grouped["Inventory"] - grouped["Accounts Payable"]
-    grouped["PPE"] = grouped.get("PPE", pd.Series(np.zeros(len(grouped))))
-    return grouped
+    return grouped.rename_axis(index="period", columns=None).reset_index()
 
 
 def _revenue_growth(cfg: ForecastConfig, year_idx: int) -> float:
@@ -127,10 +127,20 @@ def _revenue_growth(cfg: ForecastConfig, year_idx: int) -> float:
     return cfg.revenue_manual.get(year_idx, 0.0)
 
 
-def _cost_value(method: str, pct: float, fixed: float, inflation: float, revenue: float, year_idx: int, hist: pd.DataFrame, hist_col: str) -> float:
+def _roll_ppe(capex: np.ndarray, ppe_existing: float, dep_rate: float) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    existing = ppe_existing * max(1 - dep_rate, 0.0) ** np.arange(len(capex))
+    new = [0.0] * len(capex)
+    balance = 0.0
+    for idx, spend in enumerate(capex.tolist()[:-1], start=1):
+        balance = max(balance * (1 - dep_rate) + spend, 0.0)
+        new[idx] = balance
+    new = np.array(new)
+    return existing, new, existing * dep_rate, new * dep_rate
+
+
+def _cost_value(method: str, pct: float, fixed: float, inflation: float, revenue: np.ndarray, hist_mean: float) -> np.ndarray:
     if method == "pct_revenue":
         return revenue * pct
     if method == "fixed_inflation":
-        return fixed * ((1 + inflation) ** max(year_idx - 1, 0))
-    hist_series = hist[hist_col] if hist_col in hist.columns else pd.Series([0.0])
-    return float(hist_series.tail(3).mean()) if not hist_series.empty else 0.0
+        return fixed * (1 + inflation) ** np.arange(len(revenue), dtype=float)
+    return np.full(len(revenue), float(hist_mean))
@@ -5,6 +5,19 @@ from pathlib import Path
 from typing import Literal
 
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
 
 
 PeriodBasis = Literal["fiscal", "calendar"]
@@ -23,9 +36,9 @@ def load_source(path: str | Path) -> pd.DataFrame:
         raise FileNotFoundError(f"Input file not found: {path}")
 
     if path.suffix.lower() == ".csv":
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, engine=CSV_ENGINE)
     elif path.suffix.lower() in {".xlsx", ".xls"}:
-        df = pd.read_excel(path)
+        df = pd.read_excel(path, engine=EXCEL_ENGINE)
     else:
         raise ValueError("Unsupported file format. Use .csv, .xlsx, or .xls")
 
@@ -67,7 +80,9 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     renamed = {col: col.strip().lower() for col in df.columns}
     out = df.rename(columns=renamed).copy()
     out["period"] = pd.to_datetime(out["period"], errors="coerce")
-    out["amount"] = pd.to_numeric(out["amount"], errors="coerce").fillna(0.0)
+    if not is_numeric_dtype(out["amount"]):
+        out["amount"] = pd.to_numeric(out["amount"], errors="coerce")
+    out["amount"] = out["amount"].fillna(0.0)
     if "statement" not in out.columns:
         out["statement"] = ""
     if "is_non_recurring" not in out.columns:
@@ -4,7 +4,7 @@ import argparse
 import json
 from pathlib import Path
 
-from .config import DCFConfig
+from .config import DCFConfig, apply_config_override, load_config_payload
 from .pipeline import run_dcf_pipeline
 
 
@@ -36,21 +36,7 @@ def _load_config_override(config_path: str, current_cfg: DCFConfig) -> DCFConfig
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
-
-    if "forecast" in payload:
-        for key, value in payload["forecast"].items():
-            setattr(current_cfg.forecast, key, value)
-
-    if "wacc" in payload:
-        for key, value in payload["wacc"].items():
-            setattr(current_cfg.wacc, key, value)
-
-    if "valuation" in payload:
-        for key, value in payload["valuation"].items():
-            setattr(current_cfg.valuation, key, value)
-
-    return current_cfg
+    return apply_config_override(current_cfg, load_config_payload(path))
 
 
 if __name__ == "__main__":
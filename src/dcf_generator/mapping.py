@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,6 +24,23 @@ STANDARD_ACCOUNT_MAP: Dict[str, str] = {
     "debt": "Debt",
     "equity": "Equity",
 }
+STATEMENT_BY_ACCOUNT: Dict[str, str] = {
+    "Revenue": "IS",
+    "COGS": "IS",
+    "Operating Expenses": "IS",
+    "Depreciation": "IS",
+    "Cash": "BS",
+    "Accounts Receivable": "BS",
+    "Inventory": "BS",
+    "Accounts Payable": "BS",
+    "Debt": "BS",
+    "Equity": "BS",
+}
+# One lookahead branch per phrase, tried in map order, so the first listed phrase found anywhere in the name wins.
+ACCOUNT_PATTERN = re.compile(
+    "^(?:" + "|".join(f"(?=.*?({re.escape(phrase)}))" for phrase in STANDARD_ACCOUNT_MAP) + ")",
+    re.DOTALL,
+)
 
 
 @dataclass
@@ -31,29 +50,17 @@ class MappingResult:
 
 
 def map_chart_of_accounts(df: pd.DataFrame) -> MappingResult:
-    mapped = df.copy()
-    mapped["standard_account"] = mapped["account"].apply(_map_account)
-    unmapped = sorted(mapped.loc[mapped["standard_account"] == "Other", "account"].unique().tolist())
+    codes, accounts = pd.factorize(df["account"], use_na_sentinel=False)
+    groups = pd.Series(accounts, dtype=object).str.lower().str.extract(ACCOUNT_PATTERN).to_numpy()
+    matched_phrase = pd.Series(groups[np.arange(len(groups)), pd.notna(groups).argmax(axis=1)], dtype=object)
+    standard_account = pd.Series(
+        matched_phrase.map(STANDARD_ACCOUNT_MAP).fillna("Other").to_numpy()[codes], index=df.index
+    )
+    unmapped = sorted(df.loc[standard_account == "Other", "account"].unique().tolist())
 
-    mapped["statement"] = mapped.apply(_infer_statement, axis=1)
+    statement = df["statement"].astype(object)
+    statement = statement.map(str).str.upper().where(
+        statement.astype(bool), standard_account.map(STATEMENT_BY_ACCOUNT).fillna("IS")
+    )
+    mapped = df.assign(standard_account=standard_account, statement=statement)
     return MappingResult(mapped_data=mapped, unmapped_accounts=unmapped)
-
-
-def _map_account(account: str) -> str:
-    key = account.lower().strip()
-    for phrase, standard in STANDARD_ACCOUNT_MAP.items():
-        if phrase in key:
-            return standard
-    return "Other"
-
-
-def _infer_statement(row: pd.Series) -> str:
-    if row.get("statement"):
-        return str(row["statement"]).upper()
-
-    account = str(row["standard_account"])
-    if account in {"Revenue", "COGS", "Operating Expenses", "Depreciation"}:
-        return "IS"
-    if account in {"Cash", "Accounts Receivable", "Inventory", "Accounts Payable", "Debt", "Equity"}:
-        return "BS"
-    return "IS"
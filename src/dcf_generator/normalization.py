@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 
+import numpy as np
 import pandas as pd
 
 
@@ -12,16 +13,10 @@ NON_RECURRING_PATTERNS = [
     r"impairment",
     r"gain/loss",
 ]
+NON_RECURRING_RE = re.compile("|".join(NON_RECURRING_PATTERNS), re.IGNORECASE)
 
 
 def normalize_non_recurring(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    pattern = re.compile("|".join(NON_RECURRING_PATTERNS), re.IGNORECASE)
-
-    inferred_non_recurring = out["account"].astype(str).str.contains(pattern, na=False)
-    non_recurring_flag = out["is_non_recurring"] | inferred_non_recurring
-
-    out["ebitda_add_back"] = 0.0
-    mask = non_recurring_flag & out["statement"].eq("IS")
-    out.loc[mask, "ebitda_add_back"] = out.loc[mask, "amount"]
-    return out
+    inferred_non_recurring = df["account"].astype(str).str.contains(NON_RECURRING_RE, na=False)
+    mask = (df["is_non_recurring"] | inferred_non_recurring) & df["statement"].eq("IS")
+    return df.assign(ebitda_add_back=np.where(mask, df["amount"].to_numpy(dtype=float), 0.0))
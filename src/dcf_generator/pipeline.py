@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from pathlib import Path
+from typing import BinaryIO
 
+import numpy as np
 import pandas as pd
 
 from .config import DCFConfig
@@ -15,7 +16,12 @@ from .valuation import run_dcf
 from .wacc import compute_wacc, fetch_comparable_beta
 
 
-def run_dcf_pipeline(input_path: str | Path, output_path: str | Path, cfg: DCFConfig, scenario_name: str = "Base") -> dict:
+def run_dcf_pipeline(
+    input_path: str | Path,
+    output_path: str | Path | BinaryIO,
+    cfg: DCFConfig,
+    scenario_name: str = "Base",
+) -> dict:
     ingested = ingest_financials(input_path)
     mapped = map_chart_of_accounts(ingested.raw_data)
     normalized = normalize_non_recurring(mapped.mapped_data)
@@ -26,10 +32,13 @@ def run_dcf_pipeline(input_path: str | Path, output_path: str | Path, cfg: DCFCo
 
     forecast_result = build_forecast(normalized, cfg.forecast, scenario)
 
-    trailing_ebitda = _latest_account_amount(normalized, "EBITDA")
+    latest_amounts, historical_growth_3y_avg = _summarize_history(normalized)
+    trailing_ebitda = float(latest_amounts.get("EBITDA", 0.0))
     if trailing_ebitda == 0.0:
-        trailing_ebitda = _latest_account_amount(normalized, "Revenue") - _latest_account_amount(normalized, "COGS") - _latest_account_amount(normalized, "Operating Expenses")
-    trailing_depreciation = _latest_account_amount(normalized, "Depreciation")
+        trailing_ebitda = float(
+            latest_amounts.get("Revenue", 0.0) - latest_amounts.get("COGS", 0.0) - latest_amounts.get("Operating Expenses", 0.0)
+        )
+    trailing_depreciation = float(latest_amounts.get("Depreciation", 0.0))
     trailing_ebit = trailing_ebitda - trailing_depreciation
 
     proxy_cost_of_debt = cfg.wacc.risk_free_rate + 0.03
@@ -44,7 +53,7 @@ def run_dcf_pipeline(input_path: str | Path, output_path: str | Path, cfg: DCFCo
         beta = None
 
     wacc = compute_wacc(cfg.wacc, beta_override=beta)
-    valuation = run_dcf(forecast_result.forecast, wacc, cfg.valuation)
+    valuation = run_dcf(forecast_result.forecast, wacc, cfg.valuation, return_table=False)
 
     valuation_summary = {
         "WACC": wacc.wacc,
@@ -73,18 +82,6 @@ def run_dcf_pipeline(input_path: str | Path, output_path: str | Path, cfg: DCFCo
         "has_stub_period": ingested.has_stub_period,
     }
 
-    historical_revenue = (
-        normalized.loc[normalized["standard_account"] == "Revenue", ["period", "amount"]]
-        .groupby("period", as_index=False)["amount"]
-        .sum()
-        .sort_values("period")
-    )
-    historical_growth_3y_avg = 0.0
-    if len(historical_revenue) >= 2:
-        growth = historical_revenue["amount"].pct_change().dropna()
-        if not growth.empty:
-            historical_growth_3y_avg = float(growth.tail(3).mean())
-
     export_workbook(
         output_path,
         cfg=cfg,
@@ -103,75 +100,65 @@ def run_dcf_pipeline(input_path: str | Path, output_path: str | Path, cfg: DCFCo
         "valuation_summary": valuation_summary,
         "audit": audit,
         "scenario": scenario_name,
-        "config": asdict(cfg),
-        "forecast_rows": forecast_result.forecast.to_dict(orient="records"),
+        "config": cfg,
+        "forecast": forecast_result.forecast,
         "historical_growth_3y_avg": historical_growth_3y_avg,
     }
 
 
-def _build_checks(forecast_df: pd.DataFrame, cfg: DCFConfig, valuation_summary: dict) -> pd.DataFrame:
-    rows = []
-
-    for _, row in forecast_df.iterrows():
-        assets = row["AR"] + row["Inventory"]
-        liabilities_plus_equity = row["AP"] + max(assets - row["AP"], 0)
-        balance_gap = assets - liabilities_plus_equity
-
-        rows.append(
-            {
-                "period": row["period"],
-                "check": "Balance Sheet Check",
-                "value": balance_gap,
-                "status": "PASS" if abs(balance_gap) < 1e-6 else "FAIL",
-            }
-        )
+def _summarize_history(normalized: pd.DataFrame) -> tuple[pd.Series, float]:
+    ordered = normalized.sort_values("period", kind="stable")
+    latest_amounts = ordered.groupby("standard_account")["amount"].last()
 
-    rows.append(
-        {
-            "period": forecast_df.iloc[-1]["period"],
-            "check": "Terminal Growth <= GDP Growth Cap",
-            "value": cfg.valuation.terminal_growth_rate,
-            "status": "PASS" if cfg.valuation.terminal_growth_rate <= cfg.valuation.gdp_growth_cap else "ALERT",
-        }
+    revenue_amounts = (
+        ordered.loc[ordered["standard_account"] == "Revenue"].groupby("period")["amount"].sum().to_numpy(dtype=float)
     )
+    historical_growth_3y_avg = 0.0
+    if revenue_amounts.size >= 2:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = revenue_amounts[1:] / revenue_amounts[:-1] - 1.0
+        growth = growth[~np.isnan(growth)]
+        if growth.size:
+            historical_growth_3y_avg = float(growth[-3:].mean())
+    return latest_amounts, historical_growth_3y_avg
 
+
+def _build_checks(forecast_df: pd.DataFrame, cfg: DCFConfig, valuation_summary: dict) -> pd.DataFrame:
+    assets = forecast_df["AR"].to_numpy(dtype=float) + forecast_df["Inventory"].to_numpy(dtype=float)
+    payables = forecast_df["AP"].to_numpy(dtype=float)
+    balance_gap = assets - (payables + np.maximum(assets - payables, 0))
+
+    terminal_growth = cfg.valuation.terminal_growth_rate
+    growth_cap = cfg.valuation.gdp_growth_cap
     spread_floor = cfg.valuation.terminal_spread_floor_bps / 10_000
     terminal_spread = float(valuation_summary.get("Terminal WACC Spread", 0.0) or 0.0)
-    rows.append(
-        {
-            "period": forecast_df.iloc[-1]["period"],
-            "check": "Terminal Spread (WACC-g) >= Floor",
-            "value": terminal_spread,
-            "status": "PASS" if terminal_spread >= spread_floor else "ALERT",
-        }
-    )
-
-    terminal_fcf = float(forecast_df.iloc[-1]["FCF"])
-    rows.append(
+    terminal_fcf = float(forecast_df["FCF"].iat[-1])
+    terminal_checks = [
+        ("Terminal Growth <= GDP Growth Cap", terminal_growth, terminal_growth <= growth_cap),
+        ("Terminal Spread (WACC-g) >= Floor", terminal_spread, terminal_spread >= spread_floor),
+        ("Terminal Year FCF Positive", terminal_fcf, terminal_fcf > 0),
+    ]
+    if terminal_growth > growth_cap:
+        terminal_checks.append(("Sanity Alert", "Terminal Growth exceeds GDP cap", False))
+
+    periods = forecast_df["period"].to_numpy()
+    n_balance = len(balance_gap)
+    total = n_balance + len(terminal_checks)
+    check_names = np.empty(total, dtype=object)
+    statuses = np.empty(total, dtype=object)
+    check_names[:n_balance] = "Balance Sheet Check"
+    statuses[:n_balance] = np.where(np.abs(balance_gap) < 1e-6, "PASS", "FAIL")
+    values = balance_gap.tolist()
+    for offset, (name, value, passed) in enumerate(terminal_checks, start=n_balance):
+        check_names[offset] = name
+        statuses[offset] = "PASS" if passed else "ALERT"
+        values.append(value)
+
+    return pd.DataFrame(
         {
-            "period": forecast_df.iloc[-1]["period"],
-            "check": "Terminal Year FCF Positive",
-            "value": terminal_fcf,
-            "status": "PASS" if terminal_fcf > 0 else "ALERT",
+            "period": np.concatenate([periods, np.repeat(periods[-1:], len(terminal_checks))]),
+            "check": check_names,
+            "value": values,
+            "status": statuses,
         }
     )
-
-    if cfg.valuation.terminal_growth_rate > cfg.valuation.gdp_growth_cap:
-        rows.append(
-            {
-                "period": forecast_df.iloc[-1]["period"],
-                "check": "Sanity Alert",
-                "value": "Terminal Growth exceeds GDP cap",
-                "status": "ALERT",
-            }
-        )
-
-    return pd.DataFrame(rows)
-
-
-def _latest_account_amount(mapped_df: pd.DataFrame, account_name: str) -> float:
-    rows = mapped_df.loc[mapped_df["standard_account"] == account_name, ["period", "amount"]].copy()
-    if rows.empty:
-        return 0.0
-    rows = rows.sort_values("period")
-    return float(rows.iloc[-1]["amount"])
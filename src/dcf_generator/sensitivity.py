@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from .config import ValuationConfig
-from .valuation import run_dcf
+from .valuation import _enterprise_to_equity
 from .wacc import WACCResult
 
 
@@ -14,19 +15,24 @@ def build_sensitivity_table(
     wacc_values: list[float],
     growth_values: list[float],
 ) -> pd.DataFrame:
-    table = pd.DataFrame(index=[f"g={g:.2%}" for g in growth_values], columns=[f"wacc={w:.2%}" for w in wacc_values])
+    fcf = forecast["FCF"].to_numpy(dtype=np.float64)
+    periods = np.arange(1, len(fcf) + 1, dtype=np.float64)
+    if valuation_cfg.discount_convention == "mid_year":
+        periods -= 0.5
 
-    for g in growth_values:
-        for w in wacc_values:
-            updated_wacc = WACCResult(
-                cost_of_equity=base_wacc.cost_of_equity,
-                cost_of_debt_pre_tax=base_wacc.cost_of_debt_pre_tax,
-                cost_of_debt_after_tax=base_wacc.cost_of_debt_after_tax,
-                wacc=w,
-                synthetic_rating=base_wacc.synthetic_rating,
-            )
-            cfg = ValuationConfig(**{**valuation_cfg.__dict__, "terminal_growth_rate": g})
-            result = run_dcf(forecast, updated_wacc, cfg)
-            table.loc[f"g={g:.2%}", f"wacc={w:.2%}"] = result.implied_share_price_gordon
+    wacc = np.maximum(np.asarray(wacc_values, dtype=np.float64), 1e-6)
+    discount = np.exp(-periods[:, None] * np.log1p(wacc)[None, :])
+    pv_sum = fcf @ discount
 
-    return table
+    growth = np.minimum(np.asarray(growth_values, dtype=np.float64), valuation_cfg.gdp_growth_cap)[:, None]
+    spread_floor = max(valuation_cfg.terminal_spread_floor_bps / 10_000, 1e-6)
+    effective_g = np.minimum(growth, wacc - spread_floor)
+    gordon_tv = fcf[-1] * (1 + effective_g) / np.maximum(wacc - effective_g, 1e-6)
+
+    equity = _enterprise_to_equity(pv_sum + gordon_tv * discount[-1], valuation_cfg)
+    prices = equity / max(valuation_cfg.fully_diluted_shares, 1e-9)
+    return pd.DataFrame(
+        prices,
+        index=[f"g={g:.2%}" for g in growth_values],
+        columns=[f"wacc={w:.2%}" for w in wacc_values],
+    )
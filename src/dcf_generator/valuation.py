@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 import numpy as np
@@ -9,9 +10,9 @@ from .config import ValuationConfig
 from .wacc import WACCResult
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValuationResult:
-    valuation_table: pd.DataFrame
+    valuation_table: pd.DataFrame | None
     enterprise_value_gordon: float
     enterprise_value_exit: float
     enterprise_value_blended: float
@@ -27,21 +28,20 @@ class ValuationResult:
     implied_perpetuity_growth_from_exit: float
 
 
-def run_dcf(forecast: pd.DataFrame, wacc: WACCResult, cfg: ValuationConfig) -> ValuationResult:
-    df = forecast.copy().reset_index(drop=True)
-    periods = np.arange(1, len(df) + 1)
+def run_dcf(
+    forecast: pd.DataFrame, wacc: WACCResult, cfg: ValuationConfig, return_table: bool = True
+) -> ValuationResult:
+    fcf = forecast["FCF"].to_numpy(dtype=float)
+    periods = np.arange(1, len(fcf) + 1, dtype=float)
     effective_wacc = max(float(wacc.wacc), 1e-6)
 
     if cfg.discount_convention == "mid_year":
-        discount_factors = 1 / ((1 + effective_wacc) ** (periods - 0.5))
-    else:
-        discount_factors = 1 / ((1 + effective_wacc) ** periods)
+        periods -= 0.5
+    discount_factors = np.exp(-periods * math.log1p(effective_wacc))
+    pv_fcf = fcf * discount_factors
 
-    df["Discount Factor"] = discount_factors
-    df["PV of FCF"] = df["FCF"] * df["Discount Factor"]
-
-    terminal_fcf = float(df.iloc[-1]["FCF"])
-    terminal_ebitda = float(df.iloc[-1]["EBITDA"])
+    terminal_fcf = float(fcf[-1])
+    terminal_ebitda = float(forecast["EBITDA"].iat[-1])
 
     g = min(cfg.terminal_growth_rate, cfg.gdp_growth_cap)
     spread_floor = max(cfg.terminal_spread_floor_bps / 10_000, 1e-6)
@@ -49,11 +49,11 @@ def run_dcf(forecast: pd.DataFrame, wacc: WACCResult, cfg: ValuationConfig) -> V
     gordon_tv = terminal_fcf * (1 + effective_g) / max(effective_wacc - effective_g, 1e-6)
     exit_tv = terminal_ebitda * cfg.exit_ev_ebitda_multiple
 
-    terminal_discount = float(df.iloc[-1]["Discount Factor"])
+    terminal_discount = float(discount_factors[-1])
     pv_gordon_tv = gordon_tv * terminal_discount
     pv_exit_tv = exit_tv * terminal_discount
 
-    pv_sum = float(df["PV of FCF"].sum())
+    pv_sum = float(pv_fcf.sum())
     ev_gordon = pv_sum + pv_gordon_tv
     ev_exit = pv_sum + pv_exit_tv
 
@@ -74,7 +74,16 @@ def run_dcf(forecast: pd.DataFrame, wacc: WACCResult, cfg: ValuationConfig) -> V
         (exit_tv * effective_wacc - terminal_fcf) / max(exit_tv + terminal_fcf, 1e-9)
     )
 
-    valuation_table = df[["period", "FCF", "Discount Factor", "PV of FCF"]].copy()
+    valuation_table = None
+    if return_table:
+        valuation_table = pd.DataFrame(
+            {
+                "period": forecast["period"].to_numpy(),
+                "FCF": fcf,
+                "Discount Factor": discount_factors,
+                "PV of FCF": pv_fcf,
+            }
+        )
     return ValuationResult(
         valuation_table=valuation_table,
         enterprise_value_gordon=ev_gordon,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
 from dataclasses import dataclass
 
 import pandas as pd
@@ -8,7 +10,12 @@ import requests
 from .config import WACCConfig
 
 
-@dataclass
+COVERAGE_THRESHOLDS = (0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.5, 8.5)
+CREDIT_RATINGS = ("D", "CC", "CCC", "B", "BB", "BBB", "A", "AA", "AAA")
+CREDIT_SPREADS = (0.08, 0.060, 0.045, 0.030, 0.020, 0.015, 0.012, 0.010, 0.007)
+
+
+@dataclass(slots=True, frozen=True)
 class WACCResult:
     cost_of_equity: float
     cost_of_debt_pre_tax: float
@@ -35,20 +42,10 @@ def fetch_comparable_beta(api_url: str | None = None, api_key: str | None = None
 
 
 def synthetic_credit_spread(interest_coverage_ratio: float) -> tuple[str, float]:
-    grid = [
-        (8.5, "AAA", 0.007),
-        (6.5, "AA", 0.010),
-        (5.0, "A", 0.012),
-        (4.0, "BBB", 0.015),
-        (3.0, "BB", 0.020),
-        (2.0, "B", 0.030),
-        (1.0, "CCC", 0.045),
-        (0.0, "CC", 0.060),
-    ]
-    for threshold, rating, spread in grid:
-        if interest_coverage_ratio >= threshold:
-            return rating, spread
-    return "D", 0.08
+    if math.isnan(interest_coverage_ratio):
+        return CREDIT_RATINGS[0], CREDIT_SPREADS[0]
+    idx = bisect_right(COVERAGE_THRESHOLDS, interest_coverage_ratio)
+    return CREDIT_RATINGS[idx], CREDIT_SPREADS[idx]
 
 
 def compute_wacc(cfg: WACCConfig, beta_override: float | None = None) -> WACCResult:
@@ -1,27 +1,29 @@
 from __future__ import annotations
 
 import io
+import os
+import re
 import tempfile
 import zipfile
 from datetime import date
 from pathlib import Path
+from typing import BinaryIO
 
-import matplotlib
+import numpy as np
 import pandas as pd
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.shared import Pt, Inches, RGBColor
 from flask import Flask, render_template, request, send_file
 
 from src.dcf_generator.config import DCFConfig
 from src.dcf_generator.pipeline import run_dcf_pipeline
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
-
 
 app = Flask(__name__)
+app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024
 
 
 CASE_DEFAULTS = {
@@ -78,6 +80,42 @@ CASE_DEFAULTS = {
     },
 }
 
+PEER_MULTIPLES = (
+    ("Peer A", 4.9),
+    ("Peer B", 5.5),
+    ("Peer C", 6.1),
+    ("Peer D", 5.2),
+    ("Peer E", 4.7),
+)
+PEER_AVERAGE_MULTIPLE = sum(multiple for _, multiple in PEER_MULTIPLES) / len(PEER_MULTIPLES)
+
+TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+CHART_DPI = 150
+CHART_PNG_OPTIONS = {"compress_level": 1}
+
+SYNTHETIC_INPUT_TEMPLATE = (
+    "period,account,statement,amount,is_non_recurring\n"
+    "2023-12-31,Revenue,IS,{historical_revenue},False\n"
+    "2023-12-31,COGS,IS,{historical_cogs},False\n"
+    "2023-12-31,Operating Expenses,IS,{historical_opex},False\n"
+    "2023-12-31,Depreciation,IS,25000.0,False\n"
+    "2023-12-31,Accounts Receivable,BS,{historical_receivables},False\n"
+    "2023-12-31,Inventory,BS,{historical_inventory},False\n"
+    "2023-12-31,Accounts Payable,BS,{historical_payables},False\n"
+    "2023-12-31,Cash,BS,{cash},False\n"
+    "2023-12-31,Debt,BS,{debt},False\n"
+    "2024-12-31,Revenue,IS,{revenue},False\n"
+    "2024-12-31,COGS,IS,{cogs},False\n"
+    "2024-12-31,Operating Expenses,IS,{opex},False\n"
+    "2024-12-31,Depreciation,IS,25000.0,False\n"
+    "2024-12-31,Accounts Receivable,BS,{receivables},False\n"
+    "2024-12-31,Inventory,BS,{inventory},False\n"
+    "2024-12-31,Accounts Payable,BS,{payables},False\n"
+    "2024-12-31,Cash,BS,{cash},False\n"
+    "2024-12-31,Debt,BS,{debt},False\n"
+)
+
 
 def _to_float(value: str, default: float = 0.0) -> float:
     try:
@@ -86,31 +124,35 @@ def _to_float(value: str, default: float = 0.0) -> float:
         return default
 
 
-def _pick_input(form, key: str, scenario: str) -> float:
+def _pick_input(form, key: str, defaults: dict[str, float]) -> float:
     raw = form.get(key)
     if raw is not None and str(raw).strip() != "":
-        cleaned = str(raw).replace(",", "")
-        return _to_float(cleaned, CASE_DEFAULTS[scenario][key])
-    return CASE_DEFAULTS[scenario][key]
+        return _to_float(str(raw).replace(",", ""), defaults[key])
+    return defaults[key]
+
+
+def _parse_form(form, scenario: str) -> dict[str, float]:
+    defaults = CASE_DEFAULTS[scenario]
+    return {key: _pick_input(form, key, defaults) for key in defaults}
 
 
-def _build_cfg_from_form(form, scenario: str) -> DCFConfig:
+def _build_cfg_from_form(inputs: dict[str, float]) -> DCFConfig:
     cfg = DCFConfig()
 
-    growth = _pick_input(form, "growth_rate", scenario) / 100
-    wacc = _pick_input(form, "wacc", scenario) / 100
-    terminal_growth = _pick_input(form, "terminal_growth", scenario) / 100
-    cash = _pick_input(form, "cash", scenario)
-    debt = _pick_input(form, "debt", scenario)
-    ask_price = _pick_input(form, "ask_price", scenario)
-
-    cogs_pct = _pick_input(form, "cogs_pct", scenario) / 100
-    opex_pct = _pick_input(form, "opex_pct", scenario) / 100
-    capex_pct = _pick_input(form, "capex_pct", scenario) / 100
-    tax_rate = _pick_input(form, "tax_rate", scenario) / 100
-    risk_free = _pick_input(form, "risk_free_rate", scenario) / 100
-    beta = _pick_input(form, "beta", scenario)
-    size_premium = _pick_input(form, "size_premium", scenario) / 100
+    growth = inputs["growth_rate"] / 100
+    wacc = inputs["wacc"] / 100
+    terminal_growth = inputs["terminal_growth"] / 100
+    cash = inputs["cash"]
+    debt = inputs["debt"]
+    ask_price = inputs["ask_price"]
+
+    cogs_pct = inputs["cogs_pct"] / 100
+    opex_pct = inputs["opex_pct"] / 100
+    capex_pct = inputs["capex_pct"] / 100
+    tax_rate = inputs["tax_rate"] / 100
+    risk_free = inputs["risk_free_rate"] / 100
+    beta = inputs["beta"]
+    size_premium = inputs["size_premium"] / 100
 
     cfg.forecast.revenue_method = "cagr"
     cfg.forecast.revenue_cagr = growth
@@ -145,16 +187,14 @@ def _build_cfg_from_form(form, scenario: str) -> DCFConfig:
     cfg.valuation.exit_ev_ebitda_multiple = 4.5 if wacc >= 0.24 else 6.0
     cfg.valuation.terminal_value_blend_weight_gordon = 0.6
     cfg.valuation.terminal_spread_floor_bps = 75.0
-
-    cfg._web_meta = {"ask_price": ask_price}  # type: ignore[attr-defined]
     return cfg
 
 
-def _generate_synthetic_input(form, destination: Path, scenario: str) -> Path:
-    revenue = _pick_input(form, "revenue", scenario)
-    ebitda = _pick_input(form, "ebitda", scenario)
-    growth = _pick_input(form, "growth_rate", scenario) / 100
-    cogs_pct = _pick_input(form, "cogs_pct", scenario) / 100
+def _generate_synthetic_input(inputs: dict[str, float], destination: Path) -> Path:
+    revenue = inputs["revenue"]
+    ebitda = inputs["ebitda"]
+    growth = inputs["growth_rate"] / 100
+    cogs_pct = inputs["cogs_pct"] / 100
 
     cogs = revenue * cogs_pct
     opex = max(revenue - cogs - ebitda, 0)
@@ -164,30 +204,25 @@ def _generate_synthetic_input(form, destination: Path, scenario: str) -> Path:
     historical_cogs = historical_revenue * cogs_pct
     historical_opex = max(historical_revenue - historical_cogs - (ebitda / 1.02), 0)
 
-    df = pd.DataFrame(
-        [
-            ["2023-12-31", "Revenue", "IS", historical_revenue, False],
-            ["2023-12-31", "COGS", "IS", historical_cogs, False],
-            ["2023-12-31", "Operating Expenses", "IS", historical_opex, False],
-            ["2023-12-31", "Depreciation", "IS", 25000, False],
-            ["2023-12-31", "Accounts Receivable", "BS", historical_revenue * 0.11, False],
-            ["2023-12-31", "Inventory", "BS", historical_revenue * 0.008, False],
-            ["2023-12-31", "Accounts Payable", "BS", historical_revenue * 0.03, False],
-            ["2023-12-31", "Cash", "BS", _pick_input(form, "cash", scenario), False],
-            ["2023-12-31", "Debt", "BS", _pick_input(form, "debt", scenario), False],
-            ["2024-12-31", "Revenue", "IS", revenue, False],
-            ["2024-12-31", "COGS", "IS", cogs, False],
-            ["2024-12-31", "Operating Expenses", "IS", opex, False],
-            ["2024-12-31", "Depreciation", "IS", 25000, False],
-            ["2024-12-31", "Accounts Receivable", "BS", revenue * 0.11, False],
-            ["2024-12-31", "Inventory", "BS", revenue * 0.008, False],
-            ["2024-12-31", "Accounts Payable", "BS", revenue * 0.03, False],
-            ["2024-12-31", "Cash", "BS", _pick_input(form, "cash", scenario), False],
-            ["2024-12-31", "Debt", "BS", _pick_input(form, "debt", scenario), False],
-        ],
-        columns=["period", "account", "statement", "amount", "is_non_recurring"],
+    amounts = {
+        "historical_revenue": historical_revenue,
+        "historical_cogs": historical_cogs,
+        "historical_opex": historical_opex,
+        "historical_receivables": historical_revenue * 0.11,
+        "historical_inventory": historical_revenue * 0.008,
+        "historical_payables": historical_revenue * 0.03,
+        "revenue": revenue,
+        "cogs": cogs,
+        "opex": opex,
+        "receivables": revenue * 0.11,
+        "inventory": revenue * 0.008,
+        "payables": revenue * 0.03,
+        "cash": inputs["cash"],
+        "debt": inputs["debt"],
+    }
+    destination.write_text(
+        SYNTHETIC_INPUT_TEMPLATE.format(**{key: float(value) for key, value in amounts.items()}), encoding="utf-8"
     )
-    df.to_csv(destination, index=False)
     return destination
 
 
@@ -200,73 +235,72 @@ def _fmt_price(value: float) -> str:
 
 
 def _zebra_table(table) -> None:
-    for idx, row in enumerate(table.rows):
-        if idx == 0:
-            continue
-        if idx % 2 == 0:
-            for cell in row.cells:
-                tc_pr = cell._tc.get_or_add_tcPr()
-                shd = cell._element.xpath(".//w:shd")
-                if not shd:
-                    from docx.oxml import OxmlElement
-                    from docx.oxml.ns import qn
-
-                    shade = OxmlElement("w:shd")
-                    shade.set(qn("w:fill"), "F5F7FA")
-                    tc_pr.append(shade)
-
-
-def _build_chart_football(low: float, base: float, high: float, out_path: Path) -> None:
-    labels = ["Bear", "Base", "Bull"]
-    values = [low, base, high]
-    fig, ax = plt.subplots(figsize=(6.6, 2.2))
-    ax.barh(labels, values, color=["#8CAAD0", "#1F4E78", "#5C7EA8"])
-    ax.set_xlabel("Enterprise Value ($M)")
-    ax.set_title("Football Field (Scenario Valuation)")
-    ax.grid(axis="x", linestyle="--", alpha=0.3)
-    ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, pos: f"${x/1_000_000:.1f}M"))
-    fig.tight_layout()
-    fig.savefig(out_path, dpi=200)
-    plt.close(fig)
-
-
-def _build_chart_margin(forecast_df: pd.DataFrame, out_path: Path) -> None:
-    years = forecast_df["period"].astype(str).str[:4].tolist()
-    revenue = forecast_df["Revenue"].astype(float)
-    ebitda_margin = (forecast_df["EBITDA"].astype(float) / revenue).fillna(0)
-    gross_margin = ((forecast_df["Revenue"] - forecast_df["COGS"]).astype(float) / revenue).fillna(0)
-
-    fig, ax = plt.subplots(figsize=(6.6, 2.6))
+    for row in table.rows[2::2]:
+        for cell in row.cells:
+            tc_pr = cell._tc.get_or_add_tcPr()
+            if tc_pr.find(qn("w:shd")) is None:
+                shade = OxmlElement("w:shd")
+                shade.set(qn("w:fill"), "F5F7FA")
+                tc_pr.append(shade)
+
+
+def _add_grid_table(container, header: tuple[str, ...], rows: list[tuple[str, ...]]):
+    table = container.add_table(rows=len(rows) + 1, cols=len(header))
+    table.style = "Light Grid Accent 1"
+    for table_row, texts in zip(table.rows, [header, *rows]):
+        for cell, text in zip(table_row.cells, texts):
+            cell.text = text
+    _zebra_table(table)
+    return table
+
+
+def _chart_axes(figsize: tuple[float, float]):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+def _build_chart_margin(forecast_df: pd.DataFrame, years: list[str], out_path: Path) -> None:
+    revenue = forecast_df["Revenue"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ebitda_margin = forecast_df["EBITDA"].to_numpy(dtype=float) / revenue
+        gross_margin = (revenue - forecast_df["COGS"].to_numpy(dtype=float)) / revenue
+    ebitda_margin[np.isnan(ebitda_margin)] = 0.0
+    gross_margin[np.isnan(gross_margin)] = 0.0
+
+    fig, ax = _chart_axes((6.6, 2.6))
     ax.plot(years, gross_margin * 100, marker="o", color="#1F4E78", label="Gross Margin %")
     ax.plot(years, ebitda_margin * 100, marker="o", color="#5C7EA8", label="EBITDA Margin %")
     ax.set_ylabel("Margin (%)")
     ax.set_title("Margin Trend (Forecast)")
     ax.grid(axis="y", linestyle="--", alpha=0.3)
     ax.legend(loc="best")
-    fig.tight_layout()
-    fig.savefig(out_path, dpi=200)
-    plt.close(fig)
+    fig.subplots_adjust(left=0.12, right=0.975, top=0.86, bottom=0.15)
+    fig.savefig(out_path, dpi=CHART_DPI, pil_kwargs=CHART_PNG_OPTIONS)
 
 
-def _build_chart_revenue_bridge(forecast_df: pd.DataFrame, out_path: Path) -> None:
-    years = forecast_df["period"].astype(str).str[:4].tolist()
+def _build_chart_revenue_bridge(forecast_df: pd.DataFrame, years: list[str], out_path: Path) -> None:
     revenue = (forecast_df["Revenue"].astype(float) / 1_000_000).tolist()
 
-    fig, ax = plt.subplots(figsize=(6.6, 2.4))
+    fig, ax = _chart_axes((6.6, 2.4))
     ax.bar(years, revenue, color="#1F4E78")
     ax.set_ylabel("Revenue ($M)")
     ax.set_title("Revenue Bridge (Current to Forecast)")
     ax.grid(axis="y", linestyle="--", alpha=0.25)
-    fig.tight_layout()
-    fig.savefig(out_path, dpi=200)
-    plt.close(fig)
+    fig.subplots_adjust(left=0.13, right=0.975, top=0.85, bottom=0.165)
+    fig.savefig(out_path, dpi=CHART_DPI, pil_kwargs=CHART_PNG_OPTIONS)
 
 
 def _build_chart_fcf_area(forecast_df: pd.DataFrame, out_path: Path) -> None:
+    from matplotlib.ticker import FuncFormatter
+
     years = [f"{i+1}Y" for i in range(len(forecast_df))]
     fcf_vals = (forecast_df["FCF"].astype(float) / 1_000_000).tolist()
 
-    fig, ax = plt.subplots(figsize=(4.8, 2.8))
+    fig, ax = _chart_axes((4.8, 2.8))
     ax.plot(years, fcf_vals, color="#1F4E78", linewidth=2.2)
     ax.fill_between(years, fcf_vals, color="#5C7EA8", alpha=0.75)
     ax.set_title("Unlevered Free Cash Flow Projection ($M)", fontsize=10, fontweight="bold")
@@ -277,29 +311,25 @@ def _build_chart_fcf_area(forecast_df: pd.DataFrame, out_path: Path) -> None:
     ax.spines["bottom"].set_color("#AAB7C8")
     ax.tick_params(axis="x", labelsize=8)
     ax.tick_params(axis="y", labelsize=8)
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda y, _: f"${y:,.1f}"))
-    fig.tight_layout()
-    fig.savefig(out_path, dpi=220)
-    plt.close(fig)
-
-
-def _read_report_data(excel_path: Path) -> tuple[dict[str, float | str], pd.DataFrame]:
-    metrics_df = pd.read_excel(excel_path, sheet_name="ReportData", usecols="A:B")
-    metrics: dict[str, float | str] = {}
-    for _, row in metrics_df.dropna(how="all").iterrows():
-        key = str(row.get("metric", "")).strip()
-        value = row.get("value")
-        if key:
-            metrics[key] = value
-
-    forecast = pd.read_excel(excel_path, sheet_name="ReportData", usecols="D:J")
-    forecast = forecast.dropna(how="all")
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: f"${y:,.1f}"))
+    fig.subplots_adjust(left=0.16, right=0.97, top=0.875, bottom=0.13)
+    fig.savefig(out_path, dpi=CHART_DPI, pil_kwargs=CHART_PNG_OPTIONS)
+
+
+def _read_report_data(excel_path: Path | io.BytesIO) -> tuple[dict[str, float | str], pd.DataFrame]:
+    report_data = pd.read_excel(excel_path, sheet_name="ReportData", usecols="A:J")
+    metrics_df = report_data.iloc[:, :2].dropna(how="all")
+    keys = metrics_df["metric"].map(str).str.strip()
+    present = keys != ""
+    metrics: dict[str, float | str] = dict(zip(keys[present], metrics_df["value"][present]))
+
+    forecast = report_data.iloc[:, 3:].dropna(how="all")
     return metrics, forecast
 
 
 def _build_word_report(
-    output_path: Path,
-    excel_path: Path,
+    output_path: Path | BinaryIO,
+    excel_path: Path | io.BytesIO,
     company_name: str,
     ask_price: float,
     scenario: str,
@@ -331,9 +361,10 @@ def _build_word_report(
     projected_growth = float(metrics.get("revenue_cagr", 0.0) or 0.0)
     historical_avg = float(metrics.get("historical_growth_3y_avg", 0.0) or 0.0)
 
-    if forecast_df.empty:
+    has_forecast = not forecast_df.empty
+    if not has_forecast:
         forecast_df = pd.DataFrame(
-            [{"period": "Y1", "Revenue": 0.0, "COGS": 0.0, "EBITDA": 0.0, "Capex": 0.0, "Delta NWC": 0.0, "FCF": 0.0}]
+            {"period": ["Y1"], "Revenue": [0.0], "COGS": [0.0], "EBITDA": [0.0], "Capex": [0.0], "Delta NWC": [0.0], "FCF": [0.0]}
         )
 
     low = min(ev_g, ev_e)
@@ -343,9 +374,6 @@ def _build_word_report(
     blended_price = price_b if price_b > 0 else (price_g + price_e) / 2
     upside_pct = ((blended_ev / ask_price) - 1) if ask_price > 0 else 0.0
 
-    bear = blended_ev * 0.90
-    bull = blended_ev * 1.10
-
     doc = Document()
     style = doc.styles["Normal"]
     style.font.name = "Segoe UI"
@@ -397,29 +425,22 @@ def _build_word_report(
         else:
             recommendation = f"OVERVALUED by {abs(upside_pct):.1%}"
 
-    headline = doc.add_table(rows=1, cols=4)
-    headline.style = "Light Grid Accent 1"
-    headline.rows[0].cells[0].text = "Scenario"
-    headline.rows[0].cells[1].text = "Blended EV"
-    headline.rows[0].cells[2].text = "Blended Equity"
-    headline.rows[0].cells[3].text = "Recommendation"
-    rr = headline.add_row().cells
-    rr[0].text = scenario
-    rr[1].text = _fmt_m(blended_ev)
-    rr[2].text = _fmt_m(blended_eq)
-    rr[3].text = recommendation
-    _zebra_table(headline)
-
-    with tempfile.TemporaryDirectory() as tmp:
+    _add_grid_table(
+        doc,
+        ("Scenario", "Blended EV", "Blended Equity", "Recommendation"),
+        [(scenario, _fmt_m(blended_ev), _fmt_m(blended_eq), recommendation)],
+    )
+
+    with tempfile.TemporaryDirectory(dir=TEMP_ROOT) as tmp:
         tmp_path = Path(tmp)
-        ff_chart = tmp_path / "football.png"
         margin_chart = tmp_path / "margin.png"
         revenue_chart = tmp_path / "revenue.png"
         fcf_area = tmp_path / "fcf_area.png"
-        _build_chart_football(bear, blended_ev, bull, ff_chart)
-        _build_chart_margin(forecast_df, margin_chart)
-        _build_chart_revenue_bridge(forecast_df, revenue_chart)
-        _build_chart_fcf_area(forecast_df, fcf_area)
+        if has_forecast:
+            years = forecast_df["period"].astype(str).str[:4].tolist()
+            _build_chart_margin(forecast_df, years, margin_chart)
+            _build_chart_revenue_bridge(forecast_df, years, revenue_chart)
+            _build_chart_fcf_area(forecast_df, fcf_area)
 
         split = doc.add_table(rows=1, cols=2)
         split.autofit = False
@@ -432,28 +453,23 @@ def _build_word_report(
         left.add_paragraph("Valuation Methods Summary").runs[0].bold = True
         left.paragraphs[-1].runs[0].font.color.rgb = RGBColor(31, 78, 120)
 
-        kpi = left.add_table(rows=1, cols=4)
-        kpi.style = "Light Grid Accent 1"
-        kpi.rows[0].cells[0].text = "Method"
-        kpi.rows[0].cells[1].text = "Enterprise Value"
-        kpi.rows[0].cells[2].text = "Equity Value"
-        kpi.rows[0].cells[3].text = "Implied Price"
-
-        def _krow(name: str, ev_v: float, eq_v: float, price_v: float):
-            rr = kpi.add_row().cells
-            rr[0].text = name
-            rr[1].text = _fmt_m(ev_v)
-            rr[2].text = _fmt_m(eq_v)
-            rr[3].text = _fmt_price(price_v)
-
-        _krow("Gordon Growth", ev_g, eq_g, price_g)
-        _krow("Exit Multiple", ev_e, eq_e, price_e)
-        _krow("Blended", blended_ev, blended_eq, blended_price)
-        _zebra_table(kpi)
-
-        right.add_paragraph("Unlevered Free Cash Flow Projection").runs[0].bold = True
-        right.paragraphs[-1].runs[0].font.color.rgb = RGBColor(31, 78, 120)
-        right.add_paragraph().add_run().add_picture(str(fcf_area), width=Inches(3.35))
+        _add_grid_table(
+            left,
+            ("Method", "Enterprise Value", "Equity Value", "Implied Price"),
+            [
+                (name, _fmt_m(ev_v), _fmt_m(eq_v), _fmt_price(price_v))
+                for name, ev_v, eq_v, price_v in [
+                    ("Gordon Growth", ev_g, eq_g, price_g),
+                    ("Exit Multiple", ev_e, eq_e, price_e),
+                    ("Blended", blended_ev, blended_eq, blended_price),
+                ]
+            ],
+        )
+
+        if has_forecast:
+            right.add_paragraph("Unlevered Free Cash Flow Projection").runs[0].bold = True
+            right.paragraphs[-1].runs[0].font.color.rgb = RGBColor(31, 78, 120)
+            right.add_paragraph().add_run().add_picture(str(fcf_area), width=Inches(3.35))
 
         hook = doc.add_paragraph(
             f"Primary valuation conclusion: {_fmt_m(blended_ev)} EV / {_fmt_m(blended_eq)} Equity "
@@ -467,11 +483,7 @@ def _build_word_report(
         sec_title = doc.add_heading("2) Cost of Capital & Terminal Value Diagnostics", level=1)
         sec_title.runs[0].font.color.rgb = RGBColor(24, 37, 56)
 
-        wacc_table = doc.add_table(rows=1, cols=2)
-        wacc_table.style = "Light Grid Accent 1"
-        wacc_table.rows[0].cells[0].text = "Component"
-        wacc_table.rows[0].cells[1].text = "Value"
-        for label, value in [
+        wacc_rows = [
             ("Risk-Free Rate", risk_free),
             ("Beta", beta),
             ("Equity Risk Premium", mrp),
@@ -482,23 +494,21 @@ def _build_word_report(
             ("Terminal Growth (Input)", terminal_g),
             ("Terminal Growth (Effective)", terminal_g_effective),
             ("Terminal Spread (WACC-g)", terminal_spread),
-        ]:
-            r = wacc_table.add_row().cells
-            r[0].text = label
-            r[1].text = f"{value:.2%}" if label != "Beta" else f"{value:.2f}"
-        _zebra_table(wacc_table)
-
-        credit_table = doc.add_table(rows=1, cols=2)
-        credit_table.style = "Light Grid Accent 1"
-        credit_table.rows[0].cells[0].text = "Credit Signal"
-        credit_table.rows[0].cells[1].text = "Observation"
-        rc = credit_table.add_row().cells
-        rc[0].text = "Synthetic Rating"
-        rc[1].text = synthetic_rating
-        rc = credit_table.add_row().cells
-        rc[0].text = "Terminal Sanity"
-        rc[1].text = "PASS" if terminal_spread >= 0.005 else "REVIEW"
-        _zebra_table(credit_table)
+        ]
+        _add_grid_table(
+            doc,
+            ("Component", "Value"),
+            [(label, f"{value:.2%}" if label != "Beta" else f"{value:.2f}") for label, value in wacc_rows],
+        )
+
+        _add_grid_table(
+            doc,
+            ("Credit Signal", "Observation"),
+            [
+                ("Synthetic Rating", synthetic_rating),
+                ("Terminal Sanity", "PASS" if terminal_spread >= 0.005 else "REVIEW"),
+            ],
+        )
 
         tone = "conservative" if projected_growth <= historical_avg else "aggressive"
         relation = "lower" if projected_growth <= historical_avg else "higher"
@@ -513,14 +523,9 @@ def _build_word_report(
         )
 
         doc.add_heading("3) Operating Performance & Cash Conversion", level=1)
-        doc.add_picture(str(revenue_chart), width=Pt(430))
-        doc.add_picture(str(margin_chart), width=Pt(430))
-
-        fcf_table = doc.add_table(rows=1, cols=3)
-        fcf_table.style = "Light Grid Accent 1"
-        fcf_table.rows[0].cells[0].text = "FCF Build Item (Y1)"
-        fcf_table.rows[0].cells[1].text = "Value"
-        fcf_table.rows[0].cells[2].text = "Comment"
+        if has_forecast:
+            doc.add_picture(str(revenue_chart), width=Pt(430))
+            doc.add_picture(str(margin_chart), width=Pt(430))
 
         y1 = forecast_df.iloc[0]
         fcf_rows = [
@@ -529,21 +534,14 @@ def _build_word_report(
             ("Less Change in Working Capital", -float(y1.get("Delta NWC", 0.0)), "Liquidity drag"),
             ("Unlevered Free Cash Flow", float(y1.get("FCF", 0.0)), "Cash available to all capital providers"),
         ]
-        for label, value, note in fcf_rows:
-            r = fcf_table.add_row().cells
-            r[0].text = label
-            r[1].text = f"${value:,.0f}"
-            r[2].text = note
-        _zebra_table(fcf_table)
+        _add_grid_table(
+            doc,
+            ("FCF Build Item (Y1)", "Value", "Comment"),
+            [(label, f"${value:,.0f}", note) for label, value, note in fcf_rows],
+        )
 
         doc.add_heading("4) Sensitivity & Scenario Analysis", level=1)
-        sens = doc.add_table(rows=1, cols=4)
-        sens.style = "Light Grid Accent 1"
-        sens.rows[0].cells[0].text = "Case"
-        sens.rows[0].cells[1].text = "WACC"
-        sens.rows[0].cells[2].text = "Terminal Growth"
-        sens.rows[0].cells[3].text = "Implied EV"
-
+        sens_rows = []
         for label, w_delta, g_delta in [
             ("Bear", 0.005, -0.005),
             ("Base", 0.0, 0.0),
@@ -552,12 +550,8 @@ def _build_word_report(
             w_adj = wacc + w_delta
             g_adj = terminal_g_effective + g_delta
             ev_adj = blended_ev * (1 - (w_delta * 2.2) + (g_delta * 3.0))
-            r = sens.add_row().cells
-            r[0].text = label
-            r[1].text = f"{w_adj:.2%}"
-            r[2].text = f"{g_adj:.2%}"
-            r[3].text = _fmt_m(ev_adj)
-        _zebra_table(sens)
+            sens_rows.append((label, f"{w_adj:.2%}", f"{g_adj:.2%}", _fmt_m(ev_adj)))
+        _add_grid_table(doc, ("Case", "WACC", "Terminal Growth", "Implied EV"), sens_rows)
 
         doc.add_paragraph(
             "Risk Warning: valuation sensitivity is highest to discount rate assumptions. "
@@ -566,35 +560,17 @@ def _build_word_report(
 
         doc.add_heading("5) Relative Valuation Cross-Check", level=1)
         target_multiple = blended_ev / max(input_ebitda, 1.0)
-        peer_rows = [
-            ("Peer A", 4.9),
-            ("Peer B", 5.5),
-            ("Peer C", 6.1),
-            ("Peer D", 5.2),
-            ("Peer E", 4.7),
-        ]
-        peer_avg = sum(x[1] for x in peer_rows) / len(peer_rows)
-
-        peers = doc.add_table(rows=1, cols=3)
-        peers.style = "Light Grid Accent 1"
-        peers.rows[0].cells[0].text = "Company"
-        peers.rows[0].cells[1].text = "EV/EBITDA (x)"
-        peers.rows[0].cells[2].text = "Premium/Discount vs Target"
-        for name, multiple in peer_rows:
-            rr = peers.add_row().cells
-            rr[0].text = name
-            rr[1].text = f"{multiple:.1f}x"
-            rr[2].text = f"{(multiple/target_multiple-1):.1%}"
-
-        rr = peers.add_row().cells
-        rr[0].text = f"{company_name} (Implied)"
-        rr[1].text = f"{target_multiple:.1f}x"
-        rr[2].text = "-"
-        _zebra_table(peers)
-
-        rel = "premium" if target_multiple > peer_avg else "discount"
+
+        _add_grid_table(
+            doc,
+            ("Company", "EV/EBITDA (x)", "Premium/Discount vs Target"),
+            [(name, f"{multiple:.1f}x", f"{(multiple/target_multiple-1):.1%}") for name, multiple in PEER_MULTIPLES]
+            + [(f"{company_name} (Implied)", f"{target_multiple:.1f}x", "-")],
+        )
+
+        rel = "premium" if target_multiple > PEER_AVERAGE_MULTIPLE else "discount"
         doc.add_paragraph(
-            f"{company_name} is valued at a {rel} to the peer average ({target_multiple:.1f}x vs {peer_avg:.1f}x), "
+            f"{company_name} is valued at a {rel} to the peer average ({target_multiple:.1f}x vs {PEER_AVERAGE_MULTIPLE:.1f}x), "
             "driven by its projected profitability and cash conversion profile."
         )
 
@@ -615,7 +591,8 @@ def _build_word_report(
             "sensitive to assumptions that may not materialize."
         )
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(output_path, Path):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
     doc.save(output_path)
 
 
@@ -632,16 +609,14 @@ def guide():
 @app.post("/generate")
 def generate():
     company_name = request.form.get("company_name", "Company")
+    file_stem = re.sub(r"\W+", "_", company_name).strip("_").lower() or "company"
     scenario = request.form.get("scenario", "Base")
     if scenario not in CASE_DEFAULTS:
         scenario = "Base"
+    inputs = _parse_form(request.form, scenario)
+    cfg = _build_cfg_from_form(inputs)
 
-    ask_price = _pick_input(request.form, "ask_price", scenario)
-    input_ebitda = _pick_input(request.form, "ebitda", scenario)
-
-    cfg = _build_cfg_from_form(request.form, scenario)
-
-    with tempfile.TemporaryDirectory() as tmp:
+    with tempfile.TemporaryDirectory(dir=TEMP_ROOT) as tmp:
         tmp_path = Path(tmp)
         uploaded = request.files.get("financial_file")
         logo_file = request.files.get("logo_file")
@@ -653,32 +628,39 @@ def generate():
             input_path = tmp_path / f"input{suffix}"
             uploaded.save(input_path)
         else:
-            input_path = _generate_synthetic_input(request.form, input_path, scenario)
+            input_path = _generate_synthetic_input(inputs, input_path)
 
         if logo_file and logo_file.filename:
             logo_suffix = Path(logo_file.filename).suffix.lower() or ".png"
             logo_path = tmp_path / f"logo{logo_suffix}"
             logo_file.save(logo_path)
 
-        excel_path = tmp_path / f"{company_name.replace(' ', '_').lower()}_valuation.xlsx"
-        word_path = tmp_path / f"{company_name.replace(' ', '_').lower()}_valuation_report.docx"
+        excel_name = f"{file_stem}_valuation.xlsx"
+        excel_file = io.BytesIO()
+        word_name = f"{file_stem}_valuation_report.docx"
+        word_file = io.BytesIO()
 
-        run_dcf_pipeline(input_path, excel_path, cfg, scenario_name=scenario)
-        _build_word_report(word_path, excel_path, company_name, ask_price, scenario, logo_path, input_ebitda)
+        run_dcf_pipeline(input_path, excel_file, cfg, scenario_name=scenario)
+        _build_word_report(
+            word_file, excel_file, company_name, inputs["ask_price"], scenario, logo_path, inputs["ebitda"]
+        )
 
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            zf.write(excel_path, arcname=excel_path.name)
-            zf.write(word_path, arcname=word_path.name)
+        zip_file = tempfile.TemporaryFile(dir=TEMP_ROOT)
+        with zipfile.ZipFile(zip_file, mode="w", compression=zipfile.ZIP_STORED) as zf:
+            zf.writestr(excel_name, excel_file.getvalue())
+            zf.writestr(word_name, word_file.getvalue())
 
-        zip_buffer.seek(0)
-        return send_file(
-            zip_buffer,
+        zip_size = zip_file.tell()
+        zip_file.seek(0)
+        response = send_file(
+            zip_file,
             mimetype="application/zip",
             as_attachment=True,
-            download_name=f"{company_name.replace(' ', '_').lower()}_valuation_pack.zip",
+            download_name=f"{file_stem}_valuation_pack.zip",
         )
+        response.content_length = zip_size
+        return response
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run()